@@ -0,0 +1,66 @@
+"""
+app/idempotency.py
+------------------
+In-memory TTL cache backing VAPI tool-call idempotency.
+
+VAPI may redeliver a `tool-calls` webhook on a flaky network.  Re-running
+the handler would repeat the Supabase writes and — on the RED path — fire
+a second doctor transfer.  Each router keeps a TTLCache keyed on
+`toolCall.id`, filled only once a call's side effects have succeeded; a
+redelivered id found there gets the result dict that was already sent,
+and none of the side effects run again.  A redelivery after a failure
+misses the cache, so the failed write is retried.
+
+The routers use further TTLCache instances for related per-process state:
+tool calls still in flight, partially completed side effects, and the
+consent value last written per caller phone.
+
+The cache is per process.  With several uvicorn workers a retry may land
+on a different worker; move this to Redis (SET NX + EX) if that matters.
+"""
+
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from typing import Any
+
+
+class TTLCache:
+    """Bounded, TTL-expiring map that evicts the oldest write when full.
+
+    Keys are strings (a toolCall.id, a caller phone, ...); values are stored
+    as-is, so None is reserved to mean "missing".
+    """
+
+    def __init__(self, maxsize: int = 10_000, ttl: float = 3600.0) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: str) -> Any | None:
+        """Return the value cached for key, or None if unseen/expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        """Store value for key, evicting the oldest entry if full."""
+        if key == "unknown":
+            return      # placeholder id / phone — can't tell callers apart
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        """Forget key, if present."""
+        self._entries.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._entries)
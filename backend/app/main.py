@@ -1,20 +1,63 @@
+"""
+app/main.py
+-----------
+FastAPI application entry-point for the MatrAI backend.
+
+Running in production:
+    uvicorn app.main:app --loop uvloop --http httptools --workers N
+
+uvicorn[standard] ships uvloop (libuv event loop) and httptools (C HTTP
+parser); naming them explicitly makes startup fail loudly if either is
+missing instead of silently falling back to the slower pure-Python
+asyncio loop / h11 parser.  `python -m app.main` runs the same config
+with a single worker for local use.
+"""
+
+import logging
+from contextlib import asynccontextmanager
 from pathlib import Path
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import FileResponse
 from fastapi.staticfiles import StaticFiles
 
 from app.config import get_settings
+from app.responses import ORJSONResponse
 from app.routers import vapi as vapi_router
 from app.routers import vapi_tool as vapi_tool_router
 from app.routers import voice as voice_router
+from db.supabase_client import close_rest_client, get_rest_client
 
+logger = logging.getLogger(__name__)
 settings = get_settings()
 
+
+# ---------------------------------------------------------------------------
+# Lifespan — warm shared clients before the first call arrives
+# ---------------------------------------------------------------------------
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build the pooled Supabase REST client up front so the first webhook
+    # doesn't pay for client construction. A bad config must not stop the
+    # server from booting — requests will surface the same error later.
+    # Every client created here or lazily by a router is closed on shutdown.
+    try:
+        get_rest_client()
+    except Exception as exc:
+        logger.error("Supabase REST client init failed at startup: %s", exc)
+    yield
+    await close_rest_client()
+    await vapi_tool_router.close_control_client()
+    await voice_router.close_sarvam_client()
+
+
 app = FastAPI(
     title="MatrAI API",
     description="Backend API for MatrAI — AI-powered maternal health assistant",
     version="0.1.0",
+    default_response_class=ORJSONResponse,
+    lifespan=lifespan,
 )
 
 # ---------------------------------------------------------------------------
@@ -28,12 +71,37 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# No-op VAPI events (status-update, unknown types) are answered here with a
+# canned `{}` before FastAPI routing and dependency resolution run.
+app.add_middleware(vapi_router.NoopEventMiddleware)
+
 # ---------------------------------------------------------------------------
 # Static files — serves generated WAV audio (e.g. /static/consent_hi.wav)
 # ---------------------------------------------------------------------------
+# Clips are regenerated in place (filenames are not content-hashed), so allow
+# a day of caching rather than marking them immutable.
+_STATIC_CACHE_CONTROL = "public, max-age=86400"
+# uvicorn has no sendfile / pathsend support, so FileResponse streams the
+# file in chunks; 256 KB (vs Starlette's 64 KB) sends a consent clip in a
+# couple of reads instead of seven.
+_STATIC_CHUNK_SIZE = 256 * 1024
+
+
+class _CachedStaticFiles(StaticFiles):
+    """StaticFiles that lets VAPI and intermediate proxies cache the audio."""
+
+    async def get_response(self, path: str, scope):
+        response = await super().get_response(path, scope)
+        if isinstance(response, FileResponse):
+            response.chunk_size = _STATIC_CHUNK_SIZE
+        if response.status_code == 200:
+            response.headers["Cache-Control"] = _STATIC_CACHE_CONTROL
+        return response
+
+
 _STATIC_DIR = Path(__file__).resolve().parent.parent / "static"
 _STATIC_DIR.mkdir(parents=True, exist_ok=True)
-app.mount("/static", StaticFiles(directory=str(_STATIC_DIR)), name="static")
+app.mount("/static", _CachedStaticFiles(directory=str(_STATIC_DIR)), name="static")
 
 # ---------------------------------------------------------------------------
 # Routers
@@ -50,3 +118,9 @@ app.include_router(voice_router.router)
 async def health_check():
     """Returns a simple health status."""
     return {"status": "ok"}
+
+
+if __name__ == "__main__":
+    import uvicorn
+
+    uvicorn.run("app.main:app", host="0.0.0.0", port=8000, loop="uvloop", http="httptools")
@@ -0,0 +1,105 @@
+"""
+app/payload.py
+--------------
+Request-body helpers shared by the VAPI routers.
+
+VAPI webhooks are parsed with orjson (C parser) straight from the raw body
+bytes, and the body is read under a size cap so an oversized payload is
+rejected before any of it is parsed.  Tool invocations are then normalised
+into small typed ToolCall objects so handlers use attribute access instead
+of nested `.get()` chains.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import orjson
+from fastapi import HTTPException, Request
+
+# end-of-call-report is the largest VAPI message (full transcript + message
+# list); 1 MiB leaves plenty of headroom for a long call.
+MAX_BODY_BYTES = 1024 * 1024
+
+
+async def read_json_body(request: Request, max_bytes: int = MAX_BODY_BYTES) -> Any:
+    """
+    Read the request body (at most `max_bytes`) and parse it with orjson.
+
+    Raises:
+        HTTPException(413): Body (declared or actual) is larger than max_bytes.
+        HTTPException(400): Body is not valid JSON.
+    """
+    declared = request.headers.get("content-length")
+    if declared and declared.isdigit() and int(declared) > max_bytes:
+        raise HTTPException(status_code=413, detail="Payload too large")
+
+    chunks: list[bytes] = []
+    size = 0
+    async for chunk in request.stream():
+        size += len(chunk)
+        if size > max_bytes:
+            raise HTTPException(status_code=413, detail="Payload too large")
+        chunks.append(chunk)
+
+    try:
+        return orjson.loads(b"".join(chunks))
+    except orjson.JSONDecodeError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+
+@dataclass(slots=True)
+class ToolCall:
+    """One entry of `message.toolWithToolCallList`, normalised across formats."""
+    id: str              # toolCall.id — echoed back as toolCallId
+    name: str            # function name ("" if VAPI sent none)
+    parameters: dict     # decoded arguments ({} if missing or malformed)
+
+
+def parse_tool_calls(message: dict) -> list[ToolCall]:
+    """
+    Normalise the tool invocations of a VAPI `tool-calls` message.
+
+    VAPI sends tool payloads in different shapes depending on how the tool
+    was registered:
+      Format A — transient/webhook tool:  tool["name"] + toolCall["parameters"]
+      Format B — dashboard-created tool:  toolCall["function"]["name"]
+                 + toolCall["function"]["arguments"] (JSON string or dict)
+    """
+    calls: list[ToolCall] = []
+    for tool in message.get("toolWithToolCallList") or ():
+        tool_call: dict = tool.get("toolCall") or {}
+        function: dict = tool_call.get("function") or {}
+
+        params: Any = function.get("arguments") or tool_call.get("parameters") or {}
+        if isinstance(params, str):
+            try:
+                params = orjson.loads(params)
+            except orjson.JSONDecodeError:
+                params = {}
+        if not isinstance(params, dict):
+            params = {}
+
+        calls.append(ToolCall(
+            id=tool_call.get("id", "unknown"),
+            name=tool.get("name") or function.get("name") or "",
+            parameters=params,
+        ))
+    return calls
+
+
+def extract_caller_phone(call: dict) -> str:
+    """
+    Return the caller's number from `call.customer` or `call.phoneNumber`.
+
+    Avoids the `.get(key, {})` chain, which allocates a throwaway dict for
+    every missing key on every webhook.
+    """
+    customer = call.get("customer")
+    if customer and (number := customer.get("number")):
+        return number
+    phone_number = call.get("phoneNumber")
+    if phone_number and (number := phone_number.get("number")):
+        return number
+    return "unknown"
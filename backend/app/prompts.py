@@ -148,6 +148,13 @@ Hamesha in shabdon se call khatam karein:
   apni ASHA didi se milein. Aap akeli nahi hain. Namaste!"
 """.strip()
 
+# The base prompt never changes between calls — format it once at import so
+# build_system_prompt() only has to append the (optional) triage block.
+_BASE_FORMATTED: str = _BASE_SYSTEM_PROMPT.format(
+    vocabulary_guide=_VOCABULARY_GUIDE.strip(),
+    hard_constraints=_HARD_CONSTRAINTS.strip(),
+)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -174,13 +181,10 @@ def build_system_prompt(
         str: The fully assembled system prompt ready for injection into
              model.messages[0].content
     """
-    prompt = _BASE_SYSTEM_PROMPT.format(
-        vocabulary_guide=_VOCABULARY_GUIDE.strip(),
-        hard_constraints=_HARD_CONSTRAINTS.strip(),
-    )
+    if not (risk_level and mandatory_action):
+        return _BASE_FORMATTED
 
-    if risk_level and mandatory_action:
-        triage_block = f"""
+    triage_block = f"""
 
 === CURRENT TRIAGE RESULT (IS CALL KE LIYE) ===
 Risk Level      : {risk_level}
@@ -190,9 +194,7 @@ Clinical Reason : {clinical_reason or 'N/A'}
 Aapko ABHI is mandatory_action ko caller ko bolna hai — exactly yeh words:
 "{mandatory_action}"
 """
-        prompt += triage_block
-
-    return prompt
+    return _BASE_FORMATTED + triage_block
 
 
 # ---------------------------------------------------------------------------
@@ -200,7 +202,7 @@ Aapko ABHI is mandatory_action ko caller ko bolna hai — exactly yeh words:
 # ---------------------------------------------------------------------------
 
 # Used in VAPI assistant-request before any triage has run
-INITIAL_SYSTEM_PROMPT: str = build_system_prompt()
+INITIAL_SYSTEM_PROMPT: str = _BASE_FORMATTED
 
 # Convenience builder shortcuts
 def red_alert_prompt(mandatory_action: str, clinical_reason: str = "") -> str:
@@ -0,0 +1,23 @@
+"""
+app/responses.py
+----------------
+Shared response classes for the MatrAI API.
+
+FastAPI's own ORJSONResponse is deprecated in recent releases, so we keep a
+minimal equivalent here. orjson serialises in C and returns bytes directly,
+which keeps the VAPI webhook handlers well inside their response deadline.
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSONResponse that renders its content with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content)
@@ -31,43 +31,87 @@ from __future__ import annotations
 
 import logging
 import secrets
+import sys
+from collections.abc import Awaitable, Callable
+from functools import lru_cache
 from typing import Any
 
-from fastapi import APIRouter, Header, HTTPException, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Header, HTTPException, Request
+from fastapi.responses import Response
 
 from app.config import get_settings
+from app.idempotency import TTLCache
+from app.payload import (
+    MAX_BODY_BYTES,
+    extract_caller_phone,
+    parse_tool_calls,
+    read_json_body,
+)
 from app.prompts import INITIAL_SYSTEM_PROMPT
+from app.responses import ORJSONResponse
 from app.routers.vapi_tool import COLLECT_SYMPTOMS_TOOL
-from db.supabase_client import get_supabase_client, save_call_summary
+from db.supabase_client import get_rest_client, save_call_summary
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/vapi", tags=["VAPI"])
+router = APIRouter(prefix="/vapi", tags=["VAPI"], default_response_class=ORJSONResponse)
 
 # ---------------------------------------------------------------------------
 # Constants
 # ---------------------------------------------------------------------------
 
-# URL where the static consent audio is served.
-# In production replace with your actual domain, e.g. "https://api.matrai.in"
+# VAPI message types and tool names, interned so the literal keys in the
+# dispatch table and comparisons below share a single object.
+_EVT_ASSISTANT_REQUEST = sys.intern("assistant-request")
+_EVT_TOOL_CALLS        = sys.intern("tool-calls")
+_EVT_STATUS_UPDATE     = sys.intern("status-update")
+_EVT_END_OF_CALL       = sys.intern("end-of-call-report")
+_RECORD_CONSENT        = sys.intern("record_consent")
+
+# Fallback root URL of this server, used when BASE_URL is not configured.
+# In production set BASE_URL to your actual domain, e.g. "https://api.matrai.in"
 _BASE_URL = "http://localhost:8000"
-_CONSENT_AUDIO_URL = f"{_BASE_URL}/static/consent_hi.wav"
+# base_url from settings if configured, else the default — resolved once.
+_RESOLVED_BASE_URL: str = getattr(get_settings(), "base_url", _BASE_URL) or _BASE_URL
+
+
+def _load_webhook_secret() -> bytes | None:
+    """
+    Resolve VAPI_WEBHOOK_SECRET once at import.
+
+    Returns None when the secret is unset or still the .env.example
+    placeholder ("your_..."), which disables verification.
+    """
+    raw: str = getattr(get_settings(), "vapi_webhook_secret", "") or ""
+    if not raw or raw.startswith("your_"):
+        return None
+    return raw.encode()
+
+
+# Settings are cached for the process lifetime, so the secret (and whether
+# verification is enabled at all) is decided once rather than per request.
+_EXPECTED_SECRET: bytes | None = _load_webhook_secret()
 
 
 def _build_assistant(base_url: str = _BASE_URL) -> dict:
     """
-    Build the transient VAPI assistant definition at call-time.
+    Build the transient VAPI assistant definition for a deployment.
 
-    Injecting base_url at runtime means we can point tool server URLs at
-    the live ngrok tunnel (or production domain) without hardcoding.
+    Not called per inbound call: _assistant_response_body() builds and
+    encodes it once per base_url (lru_cache), and this deployment's body
+    is prepared at import.  Taking base_url as a parameter means we can
+    point tool server URLs at the live ngrok tunnel (or production domain)
+    without hardcoding; scripts/make_call.py also calls it directly.
 
     Args:
         base_url: Root URL of this FastAPI server (no trailing slash).
     """
-    # Deep-copy the schema so we don't mutate the module-level constant
-    import copy
-    tool_def = copy.deepcopy(COLLECT_SYMPTOMS_TOOL)
-    tool_def["server"]["url"] = f"{base_url}/vapi/tool"
+    # Only `server` differs per deployment — copy that level and share the
+    # rest of the (never mutated) schema instead of deep-copying it
+    tool_def = {
+        **COLLECT_SYMPTOMS_TOOL,
+        "server": {**COLLECT_SYMPTOMS_TOOL["server"], "url": f"{base_url}/vapi/tool"},
+    }
 
     return {
         "firstMessage": (
@@ -92,7 +136,7 @@ def _build_assistant(base_url: str = _BASE_URL) -> dict:
                 {
                     "type": "function",
                     "function": {
-                        "name": "record_consent",
+                        "name": _RECORD_CONSENT,
                         "description": (
                             "Records whether the caller consented to call recording. "
                             "Call this when the user presses 1 (consent) or 2 (decline)."
@@ -119,48 +163,104 @@ def _build_assistant(base_url: str = _BASE_URL) -> dict:
             ],
         },
         "serverMessages": [
-            "tool-calls",
-            "status-update",
-            "end-of-call-report",
+            _EVT_TOOL_CALLS,
+            _EVT_STATUS_UPDATE,
+            _EVT_END_OF_CALL,
         ],
     }
 
 
+@lru_cache(maxsize=4)
+def _assistant_response_body(base_url: str) -> bytes:
+    """
+    Return the pre-serialised `{"assistant": {...}}` response body.
+
+    The assistant definition depends only on base_url, which is fixed per
+    deployment, so it is built and JSON-encoded once instead of on every
+    inbound call.
+    """
+    return orjson.dumps({"assistant": _build_assistant(base_url)})
+
+
+# This deployment's response body, encoded at import so the very first
+# inbound call doesn't pay for building it.
+_ASSISTANT_RESPONSE_BODY: bytes = _assistant_response_body(_RESOLVED_BASE_URL)
+
+
 # ---------------------------------------------------------------------------
 # Helper: update consent in Supabase
 # ---------------------------------------------------------------------------
 
-async def _update_consent(phone: str, consent: bool) -> None:
+# return=minimal: PostgREST answers 201 with no body, so there is nothing
+# to download or parse — a 2xx status is the success signal.
+_CONSENT_UPSERT_HEADERS: dict[str, str] = {
+    "Prefer": "resolution=merge-duplicates,return=minimal",
+    "Content-Type": "application/json",
+}
+
+
+async def _update_consent(consents: dict[str, bool], replies: dict[str, dict]) -> None:
     """
-    Upsert the user's consent_given flag in the `users` table.
+    Upsert the consent_given flag for one or more callers in the `users` table.
 
-    If no user row exists for this phone number yet, one is created
+    If no user row exists for a phone number yet, one is created
     (phone-first registration — common for IVR flows where the user
     hasn't gone through an app sign-up).
 
+    All record_consent calls from one webhook are written in a single bulk
+    upsert.  Keys are unique phones, as PostgREST rejects a bulk upsert that
+    touches the same conflict row twice.
+
+    Runs as a background task after the tool result has been returned to
+    VAPI.  The upsert is a direct PostgREST call over the shared pooled
+    AsyncClient, so it never blocks the event loop.  DB errors are logged
+    here because there is no caller left to handle them.
+
     Args:
-        phone:   Caller's phone number (E.164 format, e.g. "+919876543210").
-        consent: True if the caller pressed 1, False if they pressed 2.
+        consents: Caller phone (E.164, e.g. "+919876543210") → True if they
+                  pressed 1, False if they pressed 2.
+        replies:  toolCallId → result sent to VAPI.  Cached for replay only
+                  once the upsert has succeeded, so a redelivery after a
+                  failed write retries it.
     """
-    supabase = get_supabase_client()
-
-    result = (
-        supabase
-        .table("users")
-        .upsert(
-            {"phone": phone, "consent_given": consent},
-            on_conflict="phone",        # update if phone already exists
-        )
-        .execute()
-    )
+    # Skip callers whose consent we already wrote with the same value
+    pending = {
+        phone: consent for phone, consent in consents.items()
+        if _CONSENT_CACHE.get(phone) != consent
+    }
+    if not pending:
+        logger.debug("Consent unchanged, skipping upsert: %s", consents)
+        _remember_replies(replies)
+        return
+    consents = pending
 
-    if not result.data:
-        logger.warning("Supabase upsert returned no data for phone=%s", phone)
-    else:
-        logger.info(
-            "Consent updated: phone=%s  consent_given=%s",
-            phone, consent,
+    rows = [{"phone": phone, "consent_given": consent} for phone, consent in consents.items()]
+    try:
+        resp = await get_rest_client().post(
+            "/users",
+            params={"on_conflict": "phone"},    # update if phone already exists
+            headers=_CONSENT_UPSERT_HEADERS,
+            content=orjson.dumps(rows),
         )
+        resp.raise_for_status()
+    except Exception as exc:
+        logger.error("Failed to update consent for phones=%s: %s", list(consents), exc)
+        # The stored value is unknown now — forget it so the next answer
+        # from these callers is always written.
+        for phone in consents:
+            _CONSENT_CACHE.discard(phone)
+        return
+
+    logger.info("Consent updated: %s", consents)
+    for phone, consent in consents.items():
+        _CONSENT_CACHE.put(phone, consent)
+    _remember_replies(replies)
+
+
+def _remember_replies(replies: dict[str, dict]) -> None:
+    """Cache record_consent results whose upsert has landed, for replay."""
+    for tool_call_id, result in replies.items():
+        _SEEN_TOOL_CALLS.put(tool_call_id, result)
 
 
 # ---------------------------------------------------------------------------
@@ -171,7 +271,7 @@ async def _update_consent(phone: str, consent: bool) -> None:
 async def vapi_webhook(
     request: Request,
     x_vapi_secret: str | None = Header(default=None, alias="x-vapi-secret"),
-) -> JSONResponse:
+) -> Response:
     """
     Single entry-point for all VAPI server messages.
 
@@ -186,7 +286,7 @@ async def vapi_webhook(
         rejected with HTTP 401.
 
     Returns:
-        JSONResponse — shape depends on the event type:
+        JSON response — shape depends on the event type:
           - assistant-request  → { "assistant": { ... } }
           - tool-calls         → { "results": [ ... ] }
           - everything else    → {} (HTTP 200 acknowledgement)
@@ -194,67 +294,64 @@ async def vapi_webhook(
     # ------------------------------------------------------------------
     # Verify VAPI webhook secret (if configured)
     # ------------------------------------------------------------------
-    _settings = get_settings()
-    expected_secret: str | None = getattr(_settings, "vapi_webhook_secret", None)
-
-    if expected_secret and not expected_secret.startswith("your_"):
+    if _EXPECTED_SECRET is not None:
         if not x_vapi_secret:
             logger.warning("Webhook request missing x-vapi-secret header — rejected")
             raise HTTPException(status_code=401, detail="Missing webhook secret")
-        if not secrets.compare_digest(x_vapi_secret, expected_secret):
+        if not secrets.compare_digest(x_vapi_secret.encode(), _EXPECTED_SECRET):
             logger.warning("Webhook request has invalid x-vapi-secret — rejected")
             raise HTTPException(status_code=401, detail="Invalid webhook secret")
 
-    try:
-        body: dict[str, Any] = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    # NoopEventMiddleware has already decoded the body for events it passed
+    # through; fall back to reading it when the middleware isn't installed.
+    body: dict[str, Any] | None = getattr(request.state, "vapi_body", None)
+    if body is None:
+        body = await read_json_body(request)
 
     message: dict[str, Any] = body.get("message", {})
     event_type: str = message.get("type", "unknown")
 
-    logger.info("VAPI webhook received: type=%s", event_type)
+    # Every handler logs its own INFO line; keep the per-webhook trace at
+    # DEBUG so routine events don't double the log volume under load.
+    logger.debug("VAPI webhook received: type=%s", event_type)
 
-    # ------------------------------------------------------------------
-    # 1. assistant-request — inbound call just connected
-    # ------------------------------------------------------------------
-    if event_type == "assistant-request":
-        return await _handle_assistant_request(message)
+    handler = _EVENT_HANDLERS.get(event_type)
+    if handler is None:
+        # All other events — acknowledge silently
+        logger.debug("Unhandled VAPI event type: %s — acknowledged", event_type)
+        return ORJSONResponse({})
 
-    # ------------------------------------------------------------------
-    # 2. tool-calls — LLM invoked our record_consent function
-    # ------------------------------------------------------------------
-    if event_type == "tool-calls":
-        return await _handle_tool_calls(message)
+    # Handlers with no I/O are plain functions (no coroutine per call);
+    # only the ones that touch the network/DB are awaited.
+    response = handler(message)
+    if isinstance(response, Response):
+        return response
+    return await response
 
-    # ------------------------------------------------------------------
-    # 3. status-update — log meaningful status transitions
-    # ------------------------------------------------------------------
-    if event_type == "status-update":
+
+# ---------------------------------------------------------------------------
+# Status updates
+# ---------------------------------------------------------------------------
+
+def _log_status_update(message: dict) -> None:
+    """Log a call status transition."""
+    if logger.isEnabledFor(logging.INFO):
         status = message.get("status", "unknown")
-        call_id = message.get("call", {}).get("id", "?")
+        call_id = (message.get("call") or {}).get("id", "?")
         logger.info("Call %s status → %s", call_id, status)
-        return JSONResponse({})
 
-    # ------------------------------------------------------------------
-    # 4. end-of-call-report — extract transcript + triage, persist to DB
-    # ------------------------------------------------------------------
-    if event_type == "end-of-call-report":
-        await _handle_end_of_call(message)
-        return JSONResponse({})
 
-    # ------------------------------------------------------------------
-    # 5. All other events — acknowledge silently
-    # ------------------------------------------------------------------
-    logger.debug("Unhandled VAPI event type: %s — acknowledged", event_type)
-    return JSONResponse({})
+def _handle_status_update(message: dict) -> Response:
+    """Log meaningful call status transitions; no persistence."""
+    _log_status_update(message)
+    return ORJSONResponse({})
 
 
 # ---------------------------------------------------------------------------
 # End-of-call persistence
 # ---------------------------------------------------------------------------
 
-async def _handle_end_of_call(message: dict) -> None:
+def _handle_end_of_call(message: dict) -> Response:
     """
     Extract call data from the VAPI end-of-call-report payload and persist
     it to the `calls` table (and `emergency_logs` for RED calls).
@@ -271,17 +368,17 @@ async def _handle_end_of_call(message: dict) -> None:
     end-of-call payload — VAPI doesn't persist our tool results for us.
     We store what we CAN from the report, and annotate what's missing.
     In a future iteration, we can keep server-side call state in Redis.
+
+    Always acknowledges with an empty JSON body — the Supabase save runs as
+    a background task after the response, so VAPI never waits on it and
+    persistence failures are logged, never surfaced.
     """
     call:           dict = message.get("call", {})
     vapi_call_id:   str  = call.get("id", "unknown")
     ended_reason:   str  = message.get("endedReason", "unknown")
 
     # --- Phone number ---------------------------------------------------------
-    caller_phone: str = (
-        call.get("customer", {}).get("number")
-        or call.get("phoneNumber", {}).get("number")
-        or "unknown"
-    )
+    caller_phone: str = extract_caller_phone(call)
 
     logger.info(
         "end-of-call-report: call=%s  phone=%s  reason=%s",
@@ -324,8 +421,10 @@ async def _handle_end_of_call(message: dict) -> None:
         vapi_call_id, caller_phone, risk_level, len(transcript_text),
     )
 
-    # --- Persist --------------------------------------------------------------
-    call_db_id = save_call_summary(
+    # --- Persist (after the response is sent) --------------------------------
+    background = BackgroundTasks()
+    background.add_task(
+        _persist_call_summary,
         phone=caller_phone,
         vapi_call_id=vapi_call_id,
         transcript=transcript_text,
@@ -333,7 +432,12 @@ async def _handle_end_of_call(message: dict) -> None:
         symptoms_json=None,    # tool params not in end-of-call payload
         ai_advice=ai_advice,
     )
+    return ORJSONResponse({}, background=background)
+
 
+async def _persist_call_summary(*, vapi_call_id: str, **fields: Any) -> None:
+    """Save an end-of-call report via save_call_summary() and log the outcome."""
+    call_db_id = await save_call_summary(vapi_call_id=vapi_call_id, **fields)
     if call_db_id:
         logger.info("Persisted call %s → calls.id=%s", vapi_call_id, call_db_id)
     else:
@@ -356,7 +460,7 @@ def _extract_risk_from_transcript(transcript: str) -> str | None:
     return None
 
 
-async def _handle_assistant_request(message: dict) -> JSONResponse:
+def _handle_assistant_request(message: dict) -> Response:
     """
     Respond to an inbound call with a transient assistant.
 
@@ -364,59 +468,59 @@ async def _handle_assistant_request(message: dict) -> JSONResponse:
       1. record_consent  — consent via DTMF (posts to /vapi/webhook)
       2. collect_symptoms — triage engine (posts to /vapi/tool)
 
-    VAPI requires a response within 7.5 seconds. We build the assistant
-    definition synchronously — no DB calls in the hot path.
+    VAPI requires a response within 7.5 seconds. The assistant definition
+    is built and serialised once at import (_ASSISTANT_RESPONSE_BODY)
+    — no DB calls and no per-call dict construction in the hot path.
     """
-    call = message.get("call", {})
-    caller_phone = (
-        call.get("customer", {}).get("number")
-        or call.get("phoneNumber", {}).get("number")
-        or "unknown"
-    )
-    call_id = call.get("id", "unknown")
+    # call id / phone are only needed for this log line — skip extracting
+    # them entirely when INFO is disabled.
+    if logger.isEnabledFor(logging.INFO):
+        call = message.get("call", {})
+        logger.info(
+            "Inbound call: id=%s  caller=%s — returning MatrAI assistant",
+            call.get("id", "unknown"), extract_caller_phone(call),
+        )
 
-    logger.info(
-        "Inbound call: id=%s  caller=%s — returning MatrAI assistant",
-        call_id, caller_phone,
+    return Response(
+        content=_ASSISTANT_RESPONSE_BODY,
+        media_type="application/json",
     )
 
-    # Resolve base_url from settings if configured, else fall back to default
-    _settings = get_settings()
-    base_url: str = getattr(_settings, "base_url", _BASE_URL) or _BASE_URL
-
-    return JSONResponse({"assistant": _build_assistant(base_url)})
 
-
-async def _handle_tool_calls(message: dict) -> JSONResponse:
+def _handle_tool_calls(message: dict) -> ORJSONResponse:
     """
     Handle DTMF consent captured by the `record_consent` function tool.
 
-    VAPI sends a list of tool invocations in `toolWithToolCallList`.
+    VAPI sends a list of tool invocations in `toolWithToolCallList`
+    (normalised by parse_tool_calls, so dashboard-registered tools work too).
     We look for `record_consent`, read the `digit` parameter, and
-    update Supabase accordingly.
+    schedule one bulk Supabase upsert as a background task on the response.
 
     Response shape required by VAPI:
         { "results": [ { "toolCallId": "...", "result": "..." } ] }
     """
     call = message.get("call", {})
-    caller_phone: str = (
-        call.get("customer", {}).get("number")
-        or call.get("phoneNumber", {}).get("number")
-        or "unknown"
-    )
+    caller_phone: str = extract_caller_phone(call)
 
-    tool_list: list[dict] = message.get("toolWithToolCallList", [])
     results: list[dict] = []
+    consents: dict[str, bool] = {}      # phone → consent (last digit wins)
+    replies: dict[str, dict] = {}       # toolCallId → result, cached once written
+
+    for tool_call in parse_tool_calls(message):
+        tool_call_id: str = tool_call.id
+        parameters: dict = tool_call.parameters
+
+        # VAPI redelivery of a call whose upsert already succeeded — answer
+        # with the original result, skip the upsert
+        cached = _SEEN_TOOL_CALLS.get(tool_call_id)
+        if cached is not None:
+            logger.info("Duplicate tool call %s — replaying cached result", tool_call_id)
+            results.append(cached)
+            continue
 
-    for tool in tool_list:
-        function_name: str = tool.get("name", "")
-        tool_call: dict = tool.get("toolCall", {})
-        tool_call_id: str = tool_call.get("id", "unknown")
-        parameters: dict = tool_call.get("parameters", {})
-
-        if function_name != "record_consent":
+        if tool_call.name != _RECORD_CONSENT:
             # Unknown function — return a neutral result so VAPI doesn't hang
-            logger.warning("Unknown tool called: %s", function_name)
+            logger.warning("Unknown tool called: %s", tool_call.name)
             results.append({
                 "toolCallId": tool_call_id,
                 "result": "Function not recognised.",
@@ -426,44 +530,173 @@ async def _handle_tool_calls(message: dict) -> JSONResponse:
         digit: str = str(parameters.get("digit", "")).strip()
         phone: str = parameters.get("phone_number") or caller_phone
 
-        if digit == "1":
-            consent = True
-            spoken_result = (
-                "Aapki sehmati darj kar li gayi hai. Dhanyavaad. "
-                "Ab hum aapki madad ke liye taiyaar hain."
-            )
-        elif digit == "2":
-            consent = False
-            spoken_result = (
-                "Aapne mana kar diya. Hum call record nahi karenge. "
-                "Aap phir bhi sahayta le sakti hain."
-            )
-        else:
+        hit = _CONSENT_RESPONSES.get(digit)
+        if hit is None:
             logger.warning("record_consent called with unexpected digit=%r", digit)
             results.append({
                 "toolCallId": tool_call_id,
-                "result": "Maafi chahiye, mujhe samajh nahi aaya. Kripya 1 ya 2 dabayein.",
+                "result": _CONSENT_RETRY_MESSAGE,
             })
             continue
+        consent, spoken_result = hit
 
-        # Write to Supabase (non-blocking in the async context)
-        try:
-            await _update_consent(phone=phone, consent=consent)
-        except Exception as exc:
-            # DB failure must NOT drop the call — log and continue
-            logger.error(
-                "Failed to update consent for phone=%s: %s", phone, exc
-            )
-            spoken_result += " (Record nahi hua, kripya baad mein try karein.)"
+        consents[phone] = consent
 
-        logger.info(
-            "record_consent: phone=%s  digit=%s  consent=%s",
-            phone, digit, consent,
-        )
-
-        results.append({
+        result = {
             "toolCallId": tool_call_id,
             "result": spoken_result,   # VAPI speaks this aloud to the caller
-        })
+        }
+        replies[tool_call_id] = result
+        results.append(result)
+
+    if not consents:
+        return ORJSONResponse({"results": results})
+
+    # One line per webhook rather than one per tool call
+    logger.info("record_consent: %s", consents)
+
+    # Write to Supabase after the response is sent — VAPI gets the spoken
+    # result without waiting on the Supabase round-trip, and every consent
+    # in this webhook goes out as one bulk upsert.
+    background = BackgroundTasks()
+    background.add_task(_update_consent, consents, replies)
+    return ORJSONResponse({"results": results}, background=background)
+
+
+# record_consent results whose consent upsert succeeded, keyed on toolCall.id
+_SEEN_TOOL_CALLS = TTLCache()
+
+# consent_given last written per caller phone — a repeat caller who answers
+# the same way skips the upsert.  Per process; back with Redis (GET/SETEX on
+# the phone) if several workers must share it.
+_CONSENT_CACHE = TTLCache(maxsize=50_000, ttl=86400.0)
+
+
+# ---------------------------------------------------------------------------
+# record_consent spoken results
+# ---------------------------------------------------------------------------
+
+# DTMF digit → (consent_given, text VAPI speaks back to the caller)
+_CONSENT_RESPONSES: dict[str, tuple[bool, str]] = {
+    "1": (
+        True,
+        "Aapki sehmati darj kar li gayi hai. Dhanyavaad. "
+        "Ab hum aapki madad ke liye taiyaar hain.",
+    ),
+    "2": (
+        False,
+        "Aapne mana kar diya. Hum call record nahi karenge. "
+        "Aap phir bhi sahayta le sakti hain.",
+    ),
+}
+_CONSENT_RETRY_MESSAGE = "Maafi chahiye, mujhe samajh nahi aaya. Kripya 1 ya 2 dabayein."
+
+
+# ---------------------------------------------------------------------------
+# Event dispatch table
+# ---------------------------------------------------------------------------
+
+# message.type → handler.  Anything not listed is acknowledged with {}.
+_EVENT_HANDLERS: dict[str, Callable[[dict], Response | Awaitable[Response]]] = {
+    _EVT_ASSISTANT_REQUEST: _handle_assistant_request,   # inbound call connected
+    _EVT_TOOL_CALLS:        _handle_tool_calls,          # record_consent invoked
+    _EVT_STATUS_UPDATE:     _handle_status_update,       # log status transitions
+    _EVT_END_OF_CALL:       _handle_end_of_call,         # persist transcript
+}
+
+
+# ---------------------------------------------------------------------------
+# ASGI short-circuit for no-op events
+# ---------------------------------------------------------------------------
+
+_WEBHOOK_PATH = f"{router.prefix}/webhook"
+_EMPTY_JSON_RESPONSE_START = {
+    "type": "http.response.start",
+    "status": 200,
+    "headers": [(b"content-type", b"application/json"), (b"content-length", b"2")],
+}
+_EMPTY_JSON_RESPONSE_BODY = {"type": "http.response.body", "body": b"{}"}
+
+
+class NoopEventMiddleware:
+    """
+    Answer no-op VAPI webhook events before FastAPI routing runs.
+
+    status-update and unrecognised message types only ever get `{}` back,
+    so for those we verify the secret, log, and reply with a pre-encoded
+    body — no route matching, dependency resolution or response encoding.
+    Every other request is replayed to the app unchanged, with the decoded
+    body stashed in `request.state.vapi_body` so it isn't parsed twice.
+    Anything the middleware can't decide on (oversized or invalid body,
+    bad secret) is passed through so the route produces the proper error.
+    """
 
-    return JSONResponse({"results": results})
+    def __init__(self, app: Callable) -> None:
+        self.app = app
+
+    async def __call__(self, scope: dict, receive: Callable, send: Callable) -> None:
+        if (
+            scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] != _WEBHOOK_PATH
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        # Buffer the body (up to the same cap read_json_body enforces)
+        chunks: list[bytes] = []
+        size = 0
+        more_body = True
+        while more_body and size <= MAX_BODY_BYTES:
+            event = await receive()
+            if event["type"] != "http.request":
+                return      # client disconnected
+            chunk = event.get("body", b"")
+            chunks.append(chunk)
+            size += len(chunk)
+            more_body = event.get("more_body", False)
+        raw = b"".join(chunks)
+
+        body: Any = None
+        if not more_body and size <= MAX_BODY_BYTES:
+            try:
+                body = orjson.loads(raw)
+            except orjson.JSONDecodeError:
+                pass
+
+        if isinstance(body, dict):
+            message = body.get("message") or {}
+            event_type = message.get("type", "unknown")
+            if (
+                (event_type == _EVT_STATUS_UPDATE or event_type not in _EVENT_HANDLERS)
+                and self._secret_ok(scope)
+            ):
+                if event_type == _EVT_STATUS_UPDATE:
+                    _log_status_update(message)
+                else:
+                    logger.debug("Unhandled VAPI event type: %s — acknowledged", event_type)
+                await send(_EMPTY_JSON_RESPONSE_START)
+                await send(_EMPTY_JSON_RESPONSE_BODY)
+                return
+            scope.setdefault("state", {})["vapi_body"] = body
+
+        replayed = False
+
+        async def replay() -> dict:
+            nonlocal replayed
+            if not replayed:
+                replayed = True
+                return {"type": "http.request", "body": raw, "more_body": more_body}
+            return await receive()
+
+        await self.app(scope, replay, send)
+
+    @staticmethod
+    def _secret_ok(scope: dict) -> bool:
+        """True if no secret is configured or the x-vapi-secret header matches."""
+        if _EXPECTED_SECRET is None:
+            return True
+        for name, value in scope["headers"]:
+            if name == b"x-vapi-secret":
+                return secrets.compare_digest(value, _EXPECTED_SECRET)
+        return False
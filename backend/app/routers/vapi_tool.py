@@ -34,23 +34,43 @@ Tool JSON schema (registered with the VAPI assistant in vapi.py):
 
 from __future__ import annotations
 
-import asyncio
-import json
 import logging
+import sys
+from functools import lru_cache
 from typing import Any
 
 import httpx
-from fastapi import APIRouter, HTTPException, Request
-from fastapi.responses import JSONResponse
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Request
 
 from app.config import get_settings
-from app.prompts import build_system_prompt
+from app.idempotency import TTLCache
+from app.payload import extract_caller_phone, parse_tool_calls, read_json_body
+from app.responses import ORJSONResponse
 from app.triage import evaluate_risk
 from db.supabase_client import save_call_summary
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/vapi", tags=["VAPI Tool"])
+router = APIRouter(prefix="/vapi", tags=["VAPI Tool"], default_response_class=ORJSONResponse)
+
+# collect_symptoms results whose transfer + save have both succeeded, keyed
+# on toolCall.id — only these are replayed without redoing side effects.
+_SEEN_TOOL_CALLS = TTLCache()
+
+# Side effects ("transfer", "save") already done for a tool call that is not
+# complete yet, so a redelivery retries only the step that failed.
+_DONE_STEPS = TTLCache()
+
+# Tool calls whose side effects are still queued or running; a redelivery
+# arriving meanwhile gets the result but does not schedule them twice.  The
+# short TTL frees an id whose background task never ran (client hung up
+# before the response was sent), so a later redelivery can retry it.
+_IN_FLIGHT = TTLCache(ttl=60.0)
+
+# Interned so every comparison against these shares a single object.
+_EVT_TOOL_CALLS   = sys.intern("tool-calls")
+_COLLECT_SYMPTOMS = sys.intern("collect_symptoms")
 
 
 # ---------------------------------------------------------------------------
@@ -60,7 +80,7 @@ router = APIRouter(prefix="/vapi", tags=["VAPI Tool"])
 COLLECT_SYMPTOMS_TOOL: dict = {
     "type": "function",
     "function": {
-        "name": "collect_symptoms",
+        "name": _COLLECT_SYMPTOMS,
         "description": (
             "Collect the pregnant caller's symptoms and run an obstetric risk "
             "assessment using PMSMA (Government of India) guidelines. "
@@ -155,7 +175,7 @@ COLLECT_SYMPTOMS_TOOL: dict = {
 # ---------------------------------------------------------------------------
 
 @router.post("/tool", summary="VAPI tool endpoint — collect_symptoms")
-async def vapi_tool(request: Request) -> JSONResponse:
+async def vapi_tool(request: Request) -> ORJSONResponse:
     """
     Receives a VAPI `tool-calls` event for the `collect_symptoms` function,
     maps the LLM parameters to evaluate_risk() input format, runs the triage
@@ -190,103 +210,90 @@ async def vapi_tool(request: Request) -> JSONResponse:
           }
         }
     """
-    try:
-        body: dict[str, Any] = await request.json()
-    except Exception:
-        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+    body: dict[str, Any] = await read_json_body(request)
 
     message: dict = body.get("message", {})
     event_type: str = message.get("type", "unknown")
 
-    if event_type != "tool-calls":
+    if event_type != _EVT_TOOL_CALLS:
         logger.warning("Unexpected event type at /vapi/tool: %s", event_type)
-        return JSONResponse({})
+        return ORJSONResponse({})
 
     call: dict        = message.get("call", {})
     call_id: str      = call.get("id", "unknown")
     control_url: str  = call.get("controlUrl", "")
+    caller_phone: str = extract_caller_phone(call)
 
-    tool_list: list[dict] = message.get("toolWithToolCallList", [])
     results: list[dict]   = []
+    # Side effects run after the response is sent (see end of function)
+    background = BackgroundTasks()
 
-    for tool in tool_list:
-        # VAPI sends tool payload in different shapes depending on how the tool was registered:
-        # Format A — transient/webhook tool:  tool["name"]  +  toolCall["parameters"]
-        # Format B — dashboard-created tool:  toolCall["function"]["name"]  +  toolCall["function"]["arguments"] (JSON str)
-        tool_call: dict    = tool.get("toolCall", {})
-        tc_function: dict  = tool_call.get("function", {})
-
-        function_name: str = (
-            tool.get("name")                        # Format A
-            or tc_function.get("name")              # Format B
-            or ""
-        )
-        tool_call_id: str = tool_call.get("id", "unknown")
-
-        # Parameters — may be a dict (Format A) or JSON string (Format B)
-        raw_params = (
-            tc_function.get("arguments")            # Format B (JSON string or dict)
-            or tool_call.get("parameters")          # Format A
-            or {}
-        )
-        if isinstance(raw_params, str):
-            try:
-                params: dict = json.loads(raw_params)
-            except Exception:
-                params = {}
-        else:
-            params = raw_params or {}
+    # parse_tool_calls normalises both VAPI tool payload shapes
+    # (transient Format A and dashboard Format B) in a single pass
+    for tool_call in parse_tool_calls(message):
+        function_name: str = tool_call.name
+        tool_call_id: str  = tool_call.id
+        params: dict       = tool_call.parameters
 
         logger.info("Tool call received: name=%r  id=%r  params=%r", function_name, tool_call_id, params)
 
+        # VAPI redelivery — answer with the original result and skip the
+        # save + doctor transfer, which already succeeded for this tool call.
+        cached = _SEEN_TOOL_CALLS.get(tool_call_id)
+        if cached is not None:
+            logger.info("Duplicate tool call %s — replaying cached result", tool_call_id)
+            results.append(cached)
+            continue
 
-        if function_name != "collect_symptoms":
+        if function_name != _COLLECT_SYMPTOMS:
             logger.warning("Unknown tool at /vapi/tool: %s", function_name)
             results.append({
                 "toolCallId": tool_call_id,
-                "result": json.dumps({"error": f"Unknown function: {function_name}"}),
+                "result": orjson.dumps({"error": f"Unknown function: {function_name}"}).decode(),
             })
             continue
 
         result_str, risk_level = _run_triage(params, tool_call_id)
-        results.append({
+        result = {
             "toolCallId": tool_call_id,
             "result": result_str,
-        })
-
-        # Persist triage result to Supabase immediately — this is the only
-        # moment we have risk_level + symptoms + call_id all at once.
-        # The end-of-call handler can't reliably extract risk_level from a
-        # Hindi transcript, so we save here and the webhook just fills in
-        # the transcript/summary when the call ends.
-        caller_phone: str = (
-            call.get("customer", {}).get("number")
-            or call.get("phoneNumber", {}).get("number")
-            or "unknown"
-        )
-        asyncio.create_task(
-            _save_triage_result(
-                vapi_call_id=call_id,
-                phone=caller_phone,
-                risk_level=risk_level,
-                symptoms=params,
-                triage_json=result_str,
-            )
-        )
+        }
+        results.append(result)
 
-        # Fire transfer in background so we don't delay the tool response
-        if risk_level == "RED" and control_url:
-            asyncio.create_task(
-                _transfer_to_doctor(control_url=control_url, call_id=call_id)
-            )
-        elif risk_level == "RED" and not control_url:
+        if _IN_FLIGHT.get(tool_call_id) is not None:
+            logger.info("Duplicate tool call %s — side effects already running", tool_call_id)
+            continue
+
+        if risk_level == "RED" and not control_url:
             logger.warning(
                 "RED alert on call %s but no controlUrl — transfer skipped. "
                 "Ensure serverMessages includes 'tool-calls' with call object.",
                 call_id,
             )
 
-    return JSONResponse({"results": results})
+        # Transfer (RED only) then persist the triage result to Supabase —
+        # this is the only moment we have risk_level + symptoms + call_id
+        # all at once.  The end-of-call handler can't reliably extract
+        # risk_level from a Hindi transcript, so we save here and the
+        # webhook just fills in the transcript/summary when the call ends.
+        # The result is cached for replay only once both have succeeded.
+        _IN_FLIGHT.put(tool_call_id, True)
+        background.add_task(
+            _complete_tool_call,
+            tool_call_id=tool_call_id,
+            result=result,
+            control_url=control_url if risk_level == "RED" else "",
+            vapi_call_id=call_id,
+            phone=caller_phone,
+            risk_level=risk_level,
+            symptoms=params,
+            triage_json=result_str,
+        )
+
+    # The tool result goes back to VAPI first (so the LLM can start speaking)
+    # and the queued transfer/save run afterwards.  Unlike bare create_task,
+    # the tasks stay referenced until done and their errors reach the log.
+    return ORJSONResponse({"results": results}, background=background)
 
 
 # ---------------------------------------------------------------------------
@@ -298,14 +305,121 @@ _BRIDGE_MESSAGE = (
     "Main aapko doctor se connect kar rahi hoon."
 )
 
+# Fixed parts of the spoken instructions, joined once at import so each
+# triage only fills in the mandatory_action / risk_level slot.
+_RED_INSTRUCTIONS_PREFIX = (
+    f"{_BRIDGE_MESSAGE} "
+    "TRIAGE COMPLETE. Risk level is RED. "
+    'You MUST say EXACTLY: "'
+)
+_RED_INSTRUCTIONS_SUFFIX = (
+    '" '
+    "Then say: 'Behen, ABHI 108 par call karein. Yeh bahut zaroori hai.'"
+)
+_INSTRUCTIONS_TEMPLATE = (
+    "TRIAGE COMPLETE. Risk level is %s. "
+    "You MUST now say the following EXACTLY word-for-word: "
+    '"%s"'
+)
+
+# Tool result when evaluate_risk() itself fails — static, so encoded once
+_TRIAGE_ERROR_RESULT: str = orjson.dumps({
+    "error": "Triage engine error. Please advise caller to visit nearest PHC.",
+    "risk_level": "YELLOW",
+}).decode()
+
+
+@lru_cache(maxsize=1)
+def _get_control_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient used for VAPI Live Call Control requests.
+
+    Reusing one pooled client means a transfer can ride an existing
+    keep-alive TLS connection to VAPI instead of handshaking on the
+    emergency path.  Connect gets a short timeout so a dead route fails
+    fast rather than eating the whole 10 s budget.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(10.0, connect=3.0),
+        limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60),
+    )
+
+
+async def close_control_client() -> None:
+    """Close the shared VAPI control client, if one was created."""
+    if _get_control_client.cache_info().currsize:
+        await _get_control_client().aclose()
+        _get_control_client.cache_clear()
+
+
+def _load_transfer_body(doctor_number: str) -> bytes | None:
+    """
+    Encode the Live Call Control transfer request once at import.
+
+    Returns None when DOCTOR_PHONE_NUMBER is unset or still the .env.example
+    placeholder ("your_..."), which disables the transfer.
+    """
+    if not doctor_number or doctor_number.startswith("your_"):
+        return None
+    return orjson.dumps({
+        "type": "transfer",
+        "destination": {
+            "type": "number",
+            "number": doctor_number,
+        },
+        "content": _BRIDGE_MESSAGE,
+    })
+
+
+# The doctor's number and bridge message never change at runtime, so every
+# RED transfer posts the same pre-encoded body.
+_DOCTOR_NUMBER: str = (getattr(get_settings(), "doctor_phone_number", "") or "").strip()
+_TRANSFER_BODY: bytes | None = _load_transfer_body(_DOCTOR_NUMBER)
+_JSON_HEADERS: dict[str, str] = {"Content-Type": "application/json"}
+
 
-async def _transfer_to_doctor(control_url: str, call_id: str) -> None:
+async def _complete_tool_call(
+    tool_call_id: str,
+    result: dict,
+    control_url: str,
+    vapi_call_id: str,
+    **save_kwargs: Any,
+) -> None:
+    """
+    Run a collect_symptoms call's side effects, then mark it replayable.
+
+    Transfer goes first — on a RED call it matters more than the save.
+    Steps that succeed are recorded in _DONE_STEPS so a VAPI redelivery
+    after a partial failure retries only what is missing (no second
+    transfer, no duplicate calls row).  The result enters _SEEN_TOOL_CALLS
+    only when every step has succeeded.
+    """
+    try:
+        done: set[str] = _DONE_STEPS.get(tool_call_id) or set()
+
+        if control_url and "transfer" not in done:
+            if await _transfer_to_doctor(control_url=control_url, call_id=vapi_call_id):
+                done.add("transfer")
+        if "save" not in done:
+            if await _save_triage_result(vapi_call_id=vapi_call_id, **save_kwargs):
+                done.add("save")
+
+        if "save" in done and (not control_url or "transfer" in done):
+            _SEEN_TOOL_CALLS.put(tool_call_id, result)
+            _DONE_STEPS.discard(tool_call_id)
+        else:
+            _DONE_STEPS.put(tool_call_id, done)
+    finally:
+        _IN_FLIGHT.discard(tool_call_id)
+
+
+async def _transfer_to_doctor(control_url: str, call_id: str) -> bool:
     """
     Call the VAPI Live Call Control API to transfer the call to the doctor.
 
-    This runs as a background asyncio task so the tool result is returned
-    to VAPI immediately (LLM starts speaking the bridge message) while the
-    transfer request is in-flight.
+    This runs as a response background task so the tool result is returned
+    to VAPI immediately (LLM starts speaking the bridge message) before the
+    transfer request goes out.
 
     VAPI Control API shape:
         POST {controlUrl}
@@ -314,40 +428,32 @@ async def _transfer_to_doctor(control_url: str, call_id: str) -> None:
           "content": "<spoken before transfer>" }
 
     Ref: https://docs.vapi.ai/calls/call-features (Transfer Call section)
-    """
-    settings = get_settings()
-    doctor_number: str = getattr(settings, "doctor_phone_number", "").strip()
 
-    if not doctor_number or doctor_number.startswith("your_"):
+    Returns True if VAPI accepted the transfer request.
+    """
+    if _TRANSFER_BODY is None:
         logger.error(
             "RED alert on call %s but DOCTOR_PHONE_NUMBER not set in .env — "
             "transfer aborted.",
             call_id,
         )
-        return
-
-    payload = {
-        "type": "transfer",
-        "destination": {
-            "type": "number",
-            "number": doctor_number,
-        },
-        "content": _BRIDGE_MESSAGE,
-    }
+        return False
 
     logger.info(
         "RED emergency: transferring call %s to doctor %s",
-        call_id, doctor_number,
+        call_id, _DOCTOR_NUMBER,
     )
 
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            resp = await client.post(control_url, json=payload)
-            resp.raise_for_status()
-            logger.info(
-                "Transfer request accepted for call %s: HTTP %s",
-                call_id, resp.status_code,
-            )
+        resp = await _get_control_client().post(
+            control_url, content=_TRANSFER_BODY, headers=_JSON_HEADERS,
+        )
+        resp.raise_for_status()
+        logger.info(
+            "Transfer request accepted for call %s: HTTP %s",
+            call_id, resp.status_code,
+        )
+        return True
     except httpx.HTTPStatusError as exc:
         logger.error(
             "Transfer failed for call %s: HTTP %s — %s",
@@ -355,6 +461,7 @@ async def _transfer_to_doctor(control_url: str, call_id: str) -> None:
         )
     except Exception as exc:
         logger.error("Transfer error for call %s: %s", call_id, exc)
+    return False
 
 
 async def _save_triage_result(
@@ -363,7 +470,7 @@ async def _save_triage_result(
     risk_level: str,
     symptoms: dict,
     triage_json: str,
-) -> None:
+) -> bool:
     """
     Persist the triage result to Supabase immediately after the tool runs.
 
@@ -374,15 +481,16 @@ async def _save_triage_result(
 
     The end-of-call handler will UPDATE this row with the full transcript
     and AI summary once the call ends (using vapi_call_id as the key).
+
+    Returns True if the row was saved.
     """
     try:
-        import json as _json
-        result_data = _json.loads(triage_json)
+        result_data = orjson.loads(triage_json)
         ai_advice = result_data.get("mandatory_action", "")
     except Exception:
         ai_advice = ""
 
-    call_db_id = save_call_summary(
+    call_db_id = await save_call_summary(
         phone=phone,
         vapi_call_id=vapi_call_id,
         transcript=None,          # filled in by end-of-call handler
@@ -395,8 +503,39 @@ async def _save_triage_result(
             "✅ Triage saved: vapi=%s  phone=%s  risk=%s  db_id=%s",
             vapi_call_id, phone, risk_level, call_db_id,
         )
-    else:
-        logger.warning("⚠️  Triage save failed for call %s", vapi_call_id)
+        return True
+    logger.warning("⚠️  Triage save failed for call %s", vapi_call_id)
+    return False
+
+
+def _build_symptoms(params: dict) -> dict:
+    """Map collect_symptoms tool parameters onto evaluate_risk()'s symptom keys."""
+    get = params.get
+    return {
+        "bleeding":        get("bleeding", "none"),
+        "severe_headache": bool(get("headache", False)),
+        "fetal_movement":  get("fetal_movement", "normal"),
+        "fever":           bool(get("fever", False)),
+        "swelling_feet":   bool(get("swelling_feet", False)),
+        "abdominal_pain":  get("abdominal_pain", "none"),
+        "convulsions":     bool(get("convulsions", False)),
+    }
+
+
+@lru_cache(maxsize=64)
+def _build_instructions(risk_level: str, mandatory_action: str) -> str:
+    """
+    Return the instructions string the LLM must follow for a triage result.
+
+    evaluate_risk() draws mandatory_action from a small fixed set of PMSMA
+    texts, so every distinct string is built once and then served from cache.
+    """
+    # For RED, prepend the bridge message so the LLM speaks it FIRST,
+    # then the mandatory_action. The actual call transfer is triggered
+    # as a separate background task in vapi_tool() above.
+    if risk_level == "RED":
+        return _RED_INSTRUCTIONS_PREFIX + mandatory_action + _RED_INSTRUCTIONS_SUFFIX
+    return _INSTRUCTIONS_TEMPLATE % (risk_level, mandatory_action)
 
 
 def _run_triage(params: dict, tool_call_id: str) -> tuple[str, str]:
@@ -409,17 +548,11 @@ def _run_triage(params: dict, tool_call_id: str) -> tuple[str, str]:
     """
     weeks: int = int(params.get("weeks_pregnant", 0))
 
-    symptoms: dict = {
-        "bleeding":        params.get("bleeding", "none"),
-        "severe_headache": bool(params.get("headache", False)),
-        "fetal_movement":  params.get("fetal_movement", "normal"),
-        "fever":           bool(params.get("fever", False)),
-        "swelling_feet":   bool(params.get("swelling_feet", False)),
-        "abdominal_pain":  params.get("abdominal_pain", "none"),
-        "convulsions":     bool(params.get("convulsions", False)),
-    }
+    symptoms = _build_symptoms(params)
 
-    logger.info(
+    # The raw params were already logged at INFO by vapi_tool(); the mapped
+    # symptoms dict is only worth formatting when debugging the mapping.
+    logger.debug(
         "collect_symptoms called: weeks=%d  symptoms=%s  tool_call_id=%s",
         weeks, symptoms, tool_call_id,
     )
@@ -428,35 +561,16 @@ def _run_triage(params: dict, tool_call_id: str) -> tuple[str, str]:
         triage: dict = evaluate_risk(symptoms)
     except Exception as exc:
         logger.error("evaluate_risk raised an exception: %s", exc)
-        return json.dumps({
-            "error": "Triage engine error. Please advise caller to visit nearest PHC.",
-            "risk_level": "YELLOW",
-        }), "YELLOW"
+        return _TRIAGE_ERROR_RESULT, "YELLOW"
 
     risk_level: str       = triage["risk_level"]
     mandatory_action: str  = triage["mandatory_action"]
     clinical_reason: str   = triage["clinical_reason"]
 
-    logger.info(
-        "Triage result: risk=%s  weeks=%d  action=%r",
-        risk_level, weeks, mandatory_action[:60],
-    )
-
-    # For RED, prepend the bridge message so the LLM speaks it FIRST,
-    # then the mandatory_action. The actual call transfer is triggered
-    # as a separate background task in vapi_tool() above.
-    if risk_level == "RED":
-        spoken_instructions = (
-            f"{_BRIDGE_MESSAGE} "
-            f"TRIAGE COMPLETE. Risk level is RED. "
-            f'You MUST say EXACTLY: "{mandatory_action}" '
-            f"Then say: 'Behen, ABHI 108 par call karein. Yeh bahut zaroori hai.'"
-        )
-    else:
-        spoken_instructions = (
-            f"TRIAGE COMPLETE. Risk level is {risk_level}. "
-            f"You MUST now say the following EXACTLY word-for-word: "
-            f'"{mandatory_action}"'
+    if logger.isEnabledFor(logging.INFO):
+        logger.info(
+            "Triage result: risk=%s  weeks=%d  action=%r",
+            risk_level, weeks, mandatory_action[:60],
         )
 
     result_payload = {
@@ -464,7 +578,8 @@ def _run_triage(params: dict, tool_call_id: str) -> tuple[str, str]:
         "mandatory_action": mandatory_action,
         "clinical_reason":  clinical_reason,
         "weeks_pregnant":   weeks,
-        "instructions":     spoken_instructions,
+        "instructions":     _build_instructions(risk_level, mandatory_action),
     }
 
-    return json.dumps(result_payload, ensure_ascii=False), risk_level
+    # orjson emits UTF-8 (no \uXXXX escaping), matching ensure_ascii=False
+    return orjson.dumps(result_payload).decode(), risk_level
@@ -22,12 +22,16 @@ Sarvam TTS docs: https://docs.sarvam.ai/api-reference-docs/text-to-speech
 
 from __future__ import annotations
 
+import asyncio
 import base64
+import hashlib
 import logging
-import struct
+from collections import OrderedDict
+from functools import lru_cache
 from typing import Any
 
 import httpx
+import orjson
 from fastapi import APIRouter, Request
 from fastapi.responses import Response
 
@@ -64,15 +68,19 @@ async def custom_voice(request: Request) -> Response:
 
     logger.info("Custom voice TTS: %r (len=%d)", text[:80], len(text))
 
-    settings = get_settings()
-    sarvam_key: str = getattr(settings, "sarvam_api_key", "").strip()
+    # Same text → same audio, so the text hash is a stable validator.  A
+    # client that already holds this utterance gets a 304 without any TTS.
+    etag: str = _text_etag(text)
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
 
-    if not sarvam_key:
+    headers = _sarvam_headers()
+    if headers is None:
         logger.error("SARVAM_API_KEY not set — cannot synthesise speech")
         return Response(status_code=503)
 
     try:
-        audio_bytes = await _synthesise_sarvam(text=text, api_key=sarvam_key)
+        audio_bytes = await _synthesise_cached(text=text, headers=headers)
     except Exception as exc:
         logger.error("Sarvam TTS failed: %s", exc, exc_info=True)
         return Response(status_code=502)
@@ -81,15 +89,110 @@ async def custom_voice(request: Request) -> Response:
     return Response(
         content=audio_bytes,
         media_type="audio/wav",
-        headers={"Content-Length": str(len(audio_bytes))},
+        headers={"Content-Length": str(len(audio_bytes)), "ETag": etag},
     )
 
 
+def _text_etag(text: str) -> str:
+    """Return a quoted strong ETag for the audio synthesised from text."""
+    return f'"{hashlib.blake2b(text.encode(), digest_size=16).hexdigest()}"'
+
+
+# ---------------------------------------------------------------------------
+# TTS cache
+# ---------------------------------------------------------------------------
+# The assistant repeats many phrases verbatim (consent prompt, retry
+# message, bridge message, PMSMA advice), and each Sarvam round-trip costs
+# hundreds of ms.  Voice, language, pace and sample rate are fixed in
+# _synthesise_sarvam(), so the text alone identifies the audio.
+#
+# Per process and in memory only; entries are a few tens of KB of 8 kHz WAV.
+
+_TTS_CACHE_SIZE = 512
+
+_tts_cache: OrderedDict[str, bytes] = OrderedDict()         # text → WAV, LRU order
+_tts_inflight: dict[str, asyncio.Task[bytes]] = {}          # text → running synthesis
+
+
+async def _synthesise_cached(text: str, headers: dict[str, str]) -> bytes:
+    """
+    Return WAV bytes for text, calling Sarvam only on a cache miss.
+
+    Concurrent misses for the same text share one Sarvam request.  Waiters
+    are shielded, so a VAPI client that disconnects mid-synthesis doesn't
+    cancel the request for the others.
+    """
+    audio = _tts_cache.get(text)
+    if audio is not None:
+        _tts_cache.move_to_end(text)
+        return audio
+
+    task = _tts_inflight.get(text)
+    if task is None:
+        task = asyncio.create_task(_synthesise_and_store(text, headers))
+        _tts_inflight[text] = task
+    return await asyncio.shield(task)
+
+
+async def _synthesise_and_store(text: str, headers: dict[str, str]) -> bytes:
+    """Synthesise text via Sarvam and add the result to the LRU cache."""
+    try:
+        audio = await _synthesise_sarvam(text=text, headers=headers)
+    finally:
+        _tts_inflight.pop(text, None)
+
+    _tts_cache[text] = audio
+    if len(_tts_cache) > _TTS_CACHE_SIZE:
+        _tts_cache.popitem(last=False)
+    return audio
+
+
 # ---------------------------------------------------------------------------
 # Sarvam TTS helper
 # ---------------------------------------------------------------------------
 
-async def _synthesise_sarvam(text: str, api_key: str) -> bytes:
+@lru_cache(maxsize=1)
+def _sarvam_headers() -> dict[str, str] | None:
+    """
+    Resolve the Sarvam request headers once, on the first TTS request.
+
+    Returns None when SARVAM_API_KEY is unset, which disables synthesis.
+    """
+    api_key: str = (getattr(get_settings(), "sarvam_api_key", "") or "").strip()
+    if not api_key:
+        return None
+    return {
+        "api-subscription-key": api_key,
+        "Content-Type": "application/json",
+    }
+
+
+@lru_cache(maxsize=1)
+def _get_sarvam_client() -> httpx.AsyncClient:
+    """
+    Return the shared AsyncClient used for Sarvam TTS requests.
+
+    VAPI asks for speech on every assistant turn, so keeping TLS connections
+    to api.sarvam.ai alive across requests saves a handshake per utterance.
+    """
+    return httpx.AsyncClient(
+        timeout=httpx.Timeout(20.0, connect=5.0),
+        limits=httpx.Limits(
+            max_connections=100,
+            max_keepalive_connections=50,
+            keepalive_expiry=60,
+        ),
+    )
+
+
+async def close_sarvam_client() -> None:
+    """Close the shared Sarvam client, if one was created."""
+    if _get_sarvam_client.cache_info().currsize:
+        await _get_sarvam_client().aclose()
+        _get_sarvam_client.cache_clear()
+
+
+async def _synthesise_sarvam(text: str, headers: dict[str, str]) -> bytes:
     """
     Call Sarvam Bulbul TTS and return WAV bytes.
 
@@ -105,20 +208,16 @@ async def _synthesise_sarvam(text: str, api_key: str) -> bytes:
         "model":                "bulbul:v3",
     }
 
-    async with httpx.AsyncClient(timeout=20.0) as client:
-        resp = await client.post(
-            SARVAM_TTS_URL,
-            headers={
-                "api-subscription-key": api_key,
-                "Content-Type": "application/json",
-            },
-            json=payload,
-        )
-        if not resp.is_success:
-            logger.error("Sarvam TTS HTTP %s: %s", resp.status_code, resp.text)
-        resp.raise_for_status()
-
-    data = resp.json()
+    resp = await _get_sarvam_client().post(
+        SARVAM_TTS_URL,
+        headers=headers,
+        json=payload,
+    )
+    if not resp.is_success:
+        logger.error("Sarvam TTS HTTP %s: %s", resp.status_code, resp.text)
+    resp.raise_for_status()
+
+    data = orjson.loads(resp.content)
     # Sarvam returns: { "audios": ["<base64-wav>", ...] }
     audios: list = data.get("audios", [])
     if not audios:
@@ -170,6 +170,29 @@ _RULES: list[_TriageRule] = [
     ),
 ]
 
+
+def _build_result(rule: _TriageRule) -> dict:
+    """Construct the triage result dict from a matched rule."""
+    return {
+        "risk_level": rule.risk_level,
+        "mandatory_action": rule.mandatory_action,
+        "clinical_reason": rule.clinical_reason,
+    }
+
+
+# (symptom_key, trigger_value, result) per severity, in table order — the
+# result dicts are built once here, so evaluate_risk() only compares values
+# and hands back a prebuilt dict.
+_RED_CHECKS: tuple[tuple[str, Any, dict], ...] = tuple(
+    (rule.symptom_key, rule.trigger_value, _build_result(rule))
+    for rule in _RULES if rule.risk_level == "RED"
+)
+_YELLOW_CHECKS: tuple[tuple[str, Any, dict], ...] = tuple(
+    (rule.symptom_key, rule.trigger_value, _build_result(rule))
+    for rule in _RULES if rule.risk_level == "YELLOW"
+)
+
+
 # Green-level fallback (no red/yellow flags triggered)
 _GREEN_RESULT: dict = {
     "risk_level": "GREEN",
@@ -224,6 +247,8 @@ def evaluate_risk(symptoms: dict) -> dict:
                 "mandatory_action": str,   # what the patient must do
                 "clinical_reason":  str,   # PMSMA-based clinical justification
             }
+        The dict is shared between calls — treat it as read-only (copy it
+        before changing anything).
 
     Examples:
         >>> evaluate_risk({"bleeding": "heavy"})
@@ -240,29 +265,17 @@ def evaluate_risk(symptoms: dict) -> dict:
             f"symptoms must be a dict, got {type(symptoms).__name__!r}"
         )
 
-    matched_red: _TriageRule | None = None
-    matched_yellow: _TriageRule | None = None
-
-    for rule in _RULES:
-        symptom_value = symptoms.get(rule.symptom_key)
-        if symptom_value == rule.trigger_value:
-            if rule.risk_level == "RED":
-                # Return immediately — RED is the highest severity
-                return _build_result(rule)
-            elif rule.risk_level == "YELLOW" and matched_yellow is None:
-                # Capture first yellow; keep scanning for possible RED
-                matched_yellow = rule
+    get = symptoms.get
 
-    if matched_yellow:
-        return _build_result(matched_yellow)
+    # All RED rules before any YELLOW one: the first RED match in table order
+    # wins outright, otherwise the first YELLOW match does.
+    for symptom_key, trigger_value, result in _RED_CHECKS:
+        if get(symptom_key) == trigger_value:
+            return result
 
-    return dict(_GREEN_RESULT)
+    for symptom_key, trigger_value, result in _YELLOW_CHECKS:
+        if get(symptom_key) == trigger_value:
+            return result
 
+    return _GREEN_RESULT
 
-def _build_result(rule: _TriageRule) -> dict:
-    """Construct the triage result dict from a matched rule."""
-    return {
-        "risk_level": rule.risk_level,
-        "mandatory_action": rule.mandatory_action,
-        "clinical_reason": rule.clinical_reason,
-    }
@@ -135,3 +135,43 @@ CREATE POLICY "calls_owner_access" ON calls
 -- Users can view their own emergency logs
 CREATE POLICY "emergency_logs_owner_access" ON emergency_logs
     FOR ALL USING (auth.uid() = user_id);
+
+
+-- ===========================================================================
+-- FUNCTION: save_call
+-- Called by db/supabase_client.save_call_summary() via PostgREST RPC.
+-- Resolves (or creates) the user by phone, inserts the call, and for RED
+-- calls writes the emergency log — one round-trip and one transaction
+-- instead of three separate requests.
+-- ===========================================================================
+CREATE OR REPLACE FUNCTION save_call(
+    p_phone          TEXT,
+    p_transcript     TEXT,
+    p_ai_advice      TEXT,
+    p_symptoms_json  JSONB,
+    p_risk_level     risk_level
+) RETURNS UUID
+LANGUAGE plpgsql
+AS $$
+DECLARE
+    v_user_id UUID;
+    v_call_id UUID;
+BEGIN
+    -- Existing users keep their row (and consent) unchanged
+    INSERT INTO users (phone) VALUES (p_phone)
+    ON CONFLICT (phone) DO UPDATE SET phone = EXCLUDED.phone
+    RETURNING id INTO v_user_id;
+
+    INSERT INTO calls (user_id, risk_level, symptoms_json, transcript, ai_advice)
+    VALUES (v_user_id, p_risk_level, COALESCE(p_symptoms_json, '{}'::jsonb), p_transcript, p_ai_advice)
+    RETURNING id INTO v_call_id;
+
+    IF p_risk_level = 'RED' THEN
+        INSERT INTO emergency_logs (call_id, user_id) VALUES (v_call_id, v_user_id);
+    END IF;
+
+    RETURN v_call_id;
+END;
+$$;
+
+COMMENT ON FUNCTION save_call IS 'Persist a call (user upsert + calls insert + RED emergency log) in one transaction.';
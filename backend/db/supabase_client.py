@@ -6,29 +6,47 @@ persistence helpers used across the app.
 
 Public API:
     get_supabase_client()   → cached Client singleton
+    get_rest_client()       → cached, pooled httpx.AsyncClient for PostgREST
+    close_rest_client()     → close the pooled AsyncClient (app shutdown)
     get_or_create_user()    → upsert user by phone, return user_id (UUID)
     save_call_summary()     → insert completed call record into `calls` table
+
+The persistence helpers are coroutines on the pooled async REST client, so
+they never block the event loop; the supabase-py Client is kept for
+synchronous callers (scripts, one-off admin tasks).
 """
 
 from __future__ import annotations
 
 import logging
 from functools import lru_cache
-from typing import Any
 
-from supabase import Client, create_client
+import httpx
+import orjson
+from supabase import Client, ClientOptions, create_client
 
 from app.config import get_settings
 
 logger = logging.getLogger(__name__)
 
+# Calls arrive minutes apart, so keep idle connections around for a minute
+# (httpx default: 5 s) to avoid a fresh TCP + TLS handshake per webhook.
+_POOL_LIMITS = httpx.Limits(max_keepalive_connections=20, keepalive_expiry=60)
+
+# Retry failed connection attempts (DNS, TCP, TLS) — never a request that
+# reached Supabase, so writes are not duplicated.
+_CONNECT_RETRIES = 2
+
 
-@lru_cache()
+@lru_cache(maxsize=1)
 def get_supabase_client() -> Client:
     """
     Return a cached Supabase client instance.
 
-    The client is created once and reused for the lifetime of the process.
+    The client is created once and reused for the lifetime of the process,
+    so its HTTP session and keep-alive connections are shared by every
+    caller.  The app itself writes through get_rest_client(); this client
+    is for synchronous callers only.
     Credentials are pulled from the app settings (loaded from .env).
 
     Returns:
@@ -44,15 +62,67 @@ def get_supabase_client() -> Client:
             "SUPABASE_URL and SUPABASE_KEY must be set in your .env file."
         )
 
-    client: Client = create_client(settings.supabase_url, settings.supabase_key)
+    client: Client = create_client(
+        settings.supabase_url,
+        settings.supabase_key,
+        options=ClientOptions(
+            # Server-side key: no user session to persist or refresh, so
+            # skip the auth bookkeeping entirely.
+            auto_refresh_token=False,
+            persist_session=False,
+            httpx_client=httpx.Client(
+                transport=httpx.HTTPTransport(limits=_POOL_LIMITS, retries=_CONNECT_RETRIES),
+                timeout=10.0,
+            ),
+        ),
+    )
     return client
 
 
+@lru_cache(maxsize=1)
+def get_rest_client() -> httpx.AsyncClient:
+    """
+    Return a cached async HTTP client for the Supabase REST (PostgREST) API.
+
+    supabase-py's query builder is synchronous; hot-path writes that must not
+    block the event loop go through this client instead.  It is created once
+    (app/main.py warms it at startup and closes it on shutdown) and keeps a
+    pool of keep-alive connections, so repeated writes skip the TCP/TLS
+    handshake.  Requests are relative to `{SUPABASE_URL}/rest/v1`.
+
+    Returns:
+        httpx.AsyncClient: Pre-authenticated client (apikey + bearer headers).
+    """
+    settings = get_settings()
+
+    if not settings.supabase_url or not settings.supabase_key:
+        raise ValueError(
+            "SUPABASE_URL and SUPABASE_KEY must be set in your .env file."
+        )
+
+    return httpx.AsyncClient(
+        base_url=f"{settings.supabase_url.rstrip('/')}/rest/v1",
+        headers={
+            "apikey":        settings.supabase_key,
+            "Authorization": f"Bearer {settings.supabase_key}",
+        },
+        transport=httpx.AsyncHTTPTransport(limits=_POOL_LIMITS, retries=_CONNECT_RETRIES),
+        timeout=10.0,
+    )
+
+
+async def close_rest_client() -> None:
+    """Close the pooled REST client, if one was created."""
+    if get_rest_client.cache_info().currsize:
+        await get_rest_client().aclose()
+        get_rest_client.cache_clear()
+
+
 # ---------------------------------------------------------------------------
 # User helpers
 # ---------------------------------------------------------------------------
 
-def get_or_create_user(phone: str) -> str | None:
+async def get_or_create_user(phone: str) -> str | None:
     """
     Upsert a user row by phone number and return their UUID.
 
@@ -69,33 +139,29 @@ def get_or_create_user(phone: str) -> str | None:
     if not phone or phone == "unknown":
         return None
 
-    supabase = get_supabase_client()
+    client = get_rest_client()
     try:
-        result = (
-            supabase
-            .table("users")
-            .upsert(
-                {"phone": phone, "consent_given": False},
-                on_conflict="phone",
-                # ignoreDuplicates keeps existing row intact (consent stays True
-                # if they already gave it — we don't downgrade it here)
-            )
-            .execute()
+        resp = await client.post(
+            "/users",
+            params={"on_conflict": "phone", "select": "id"},
+            # ignore-duplicates keeps an existing row intact (consent stays
+            # True if they already gave it — we don't downgrade it here)
+            headers={
+                "Prefer": "resolution=ignore-duplicates,return=representation",
+                "Content-Type": "application/json",
+            },
+            content=orjson.dumps({"phone": phone, "consent_given": False}),
         )
-        rows = result.data or []
+        resp.raise_for_status()
+        rows = orjson.loads(resp.content) or []
         if not rows:
-            # Row already existed and ignoreDuplicates suppressed output — fetch it
-            fetch = (
-                supabase
-                .table("users")
-                .select("id")
-                .eq("phone", phone)
-                .single()
-                .execute()
+            # Row already existed and ignore-duplicates suppressed output — fetch it
+            fetch = await client.get(
+                "/users", params={"phone": f"eq.{phone}", "select": "id"},
             )
-            return fetch.data.get("id") if fetch.data else None
-
-        return rows[0].get("id")
+            fetch.raise_for_status()
+            rows = orjson.loads(fetch.content) or []
+        return rows[0].get("id") if rows else None
     except Exception as exc:
         logger.error("get_or_create_user failed for phone=%s: %s", phone, exc)
         return None
@@ -105,7 +171,7 @@ def get_or_create_user(phone: str) -> str | None:
 # Call persistence
 # ---------------------------------------------------------------------------
 
-def save_call_summary(
+async def save_call_summary(
     *,
     phone: str,
     vapi_call_id: str,
@@ -118,7 +184,8 @@ def save_call_summary(
     Persist a completed call record to the `calls` table.
 
     This is called from the `end-of-call-report` webhook handler after VAPI
-    sends the final transcript and summary. It:
+    sends the final transcript and summary. A single `save_call` RPC
+    (db/migrations.sql) does all of this in one round-trip and transaction:
       1. Resolves (or creates) the user row from their phone number.
       2. Inserts a new row in `calls` with transcript, triage result, and advice.
       3. If risk_level == "RED", also writes to `emergency_logs` for auditing.
@@ -137,73 +204,47 @@ def save_call_summary(
     Returns:
         str | None: UUID of the new calls row, or None if insert failed.
     """
-    supabase = get_supabase_client()
-
-    # Step 1: Resolve user_id
-    user_id = get_or_create_user(phone)
-    if not user_id:
+    if not phone or phone == "unknown":
         logger.error(
-            "save_call_summary: cannot resolve user_id for phone=%s  "
-            "call_id=%s — skipping save.",
-            phone, vapi_call_id,
+            "save_call_summary: no caller phone for call_id=%s — skipping save.",
+            vapi_call_id,
         )
         return None
 
-    # Step 2: Insert into calls
-    call_row: dict[str, Any] = {
-        "user_id":      user_id,
-        "transcript":   transcript,
-        "ai_advice":    ai_advice,
-        "symptoms_json": symptoms_json or {},
-    }
-    # Only set risk_level if it's a valid enum value (schema: RED | YELLOW | GREEN)
-    if risk_level in ("RED", "YELLOW", "GREEN"):
-        call_row["risk_level"] = risk_level
+    # Only pass risk_level if it's a valid enum value (schema: RED | YELLOW | GREEN)
+    if risk_level not in ("RED", "YELLOW", "GREEN"):
+        risk_level = None
 
     try:
-        result = supabase.table("calls").insert(call_row).execute()
-        rows = result.data or []
-        if not rows:
-            logger.error(
-                "calls insert returned no data for user=%s  call=%s",
-                user_id, vapi_call_id,
-            )
-            return None
-
-        call_db_id: str = rows[0]["id"]
-        logger.info(
-            "Call saved: calls.id=%s  user=%s  risk=%s  vapi_call_id=%s",
-            call_db_id, user_id, risk_level, vapi_call_id,
+        resp = await get_rest_client().post(
+            "/rpc/save_call",
+            headers={"Content-Type": "application/json"},
+            content=orjson.dumps({
+                "p_phone":         phone,
+                "p_transcript":    transcript,
+                "p_ai_advice":     ai_advice,
+                "p_symptoms_json": symptoms_json or {},
+                "p_risk_level":    risk_level,
+            }),
         )
-
-        # Step 3: Write emergency_log for RED calls
-        if risk_level == "RED":
-            _log_emergency(supabase, call_id=call_db_id, user_id=user_id)
-
-        return call_db_id
-
+        resp.raise_for_status()
+        call_db_id: str | None = orjson.loads(resp.content)
     except Exception as exc:
         logger.error(
-            "save_call_summary DB error for user=%s  call=%s: %s",
-            user_id, vapi_call_id, exc,
+            "save_call_summary DB error for phone=%s  call=%s: %s",
+            phone, vapi_call_id, exc,
         )
         return None
 
-
-def _log_emergency(supabase: Client, call_id: str, user_id: str) -> None:
-    """
-    Insert a row in emergency_logs for RED-level calls.
-    notified_asha defaults to False — a future ASHA notification feature
-    can update this to True once the alert is sent.
-    """
-    try:
-        supabase.table("emergency_logs").insert({
-            "call_id":       call_id,
-            "user_id":       user_id,
-            "notified_asha": False,
-        }).execute()
-        logger.info("Emergency log created for call=%s  user=%s", call_id, user_id)
-    except Exception as exc:
+    if not call_db_id:
         logger.error(
-            "Failed to write emergency_log for call=%s: %s", call_id, exc
+            "save_call returned no id for phone=%s  call=%s",
+            phone, vapi_call_id,
         )
+        return None
+
+    logger.info(
+        "Call saved: calls.id=%s  phone=%s  risk=%s  vapi_call_id=%s",
+        call_db_id, phone, risk_level, vapi_call_id,
+    )
+    return call_db_id
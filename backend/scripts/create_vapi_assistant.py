@@ -16,19 +16,19 @@ from __future__ import annotations
 
 import json
 import os
+import re
 import sys
 from pathlib import Path
 
+# KEY=value lines; trailing "# comment" and surrounding whitespace dropped
+_ENV_LINE = re.compile(r"^[ \t]*([^#=\s][^=\n]*?)[ \t]*=[ \t]*([^#\n]*?)[ \t]*(?:#.*)?$", re.M)
+_ASSISTANT_ID_LINE = re.compile(r"^VAPI_ASSISTANT_ID=.*$", re.M)
+
 # Load .env first
 env_path = Path(__file__).parent.parent / ".env"
 if env_path.exists():
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        k, _, v = line.partition("=")
-        v = v.split("#")[0].strip()
-        os.environ.setdefault(k.strip(), v)
+    for k, v in _ENV_LINE.findall(env_path.read_text()):
+        os.environ.setdefault(k, v)
 
 import httpx  # noqa: E402
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -66,19 +66,12 @@ try:
     print(f"    Name : {data.get('name', '(unnamed)')}")
 
     # Write VAPI_ASSISTANT_ID to .env
-    env_text  = env_path.read_text()
-    if "VAPI_ASSISTANT_ID=" in env_text:
-        # Update existing
-        lines = []
-        for line in env_text.splitlines():
-            if line.startswith("VAPI_ASSISTANT_ID="):
-                lines.append(f"VAPI_ASSISTANT_ID={assistant_id}")
-            else:
-                lines.append(line)
-        env_path.write_text("\n".join(lines) + "\n")
-    else:
+    env_text = env_path.read_text()
+    env_text, replaced = _ASSISTANT_ID_LINE.subn(f"VAPI_ASSISTANT_ID={assistant_id}", env_text)
+    if not replaced:
         # Append
-        env_path.write_text(env_text.rstrip() + f"\nVAPI_ASSISTANT_ID={assistant_id}\n")
+        env_text = env_text.rstrip() + f"\nVAPI_ASSISTANT_ID={assistant_id}"
+    env_path.write_text(env_text.rstrip("\n") + "\n")
 
     print(f"\n    Saved to .env → VAPI_ASSISTANT_ID={assistant_id}")
     print("\n    You can now run:  venv/bin/python scripts/make_call.py")
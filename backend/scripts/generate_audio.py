@@ -12,6 +12,9 @@ Usage:
     # From the backend/ directory with venv activated:
     python scripts/generate_audio.py
 
+    # Ignore the local clip cache and re-synthesise everything:
+    python scripts/generate_audio.py --force
+
     # Or with explicit API key override:
     SARVAM_API_KEY=sk-xxx python scripts/generate_audio.py
 
@@ -27,9 +30,16 @@ References:
 
 from __future__ import annotations
 
+import argparse
+import asyncio
 import base64
+import hashlib
+import io
+import shutil
 import sys
+import wave
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 
 # ---------------------------------------------------------------------------
@@ -45,8 +55,15 @@ from app.config import get_settings  # noqa: E402  (path set above)
 # Output directory
 # ---------------------------------------------------------------------------
 STATIC_DIR = ROOT / "static"
+STATIC_REL = STATIC_DIR.relative_to(ROOT)   # for display: "static"
 STATIC_DIR.mkdir(parents=True, exist_ok=True)
 
+# Content-addressed store of previously synthesised clips, keyed by the
+# SHA-256 of the TTS parameters (see _cache_key).  Lets reruns skip the
+# Sarvam API entirely for clips whose text and voice settings are unchanged.
+# Kept outside static/, which the app serves publicly at /static.
+CACHE_DIR = ROOT / ".cache" / "audio"
+
 # ---------------------------------------------------------------------------
 # Audio clips to generate
 # ---------------------------------------------------------------------------
@@ -91,21 +108,51 @@ CLIPS: list[AudioClip] = [
 # Core generation logic
 # ---------------------------------------------------------------------------
 
-def _decode_and_save(audio_base64: str, output_path: Path) -> None:
-    """Decode a base64 WAV string from Sarvam and write it to disk."""
-    audio_bytes = base64.b64decode(audio_base64)
+def _cache_key(clip: AudioClip) -> str:
+    """SHA-256 of every parameter that affects the synthesised audio."""
+    raw = f"{clip.model}|{clip.language_code}|{clip.speaker}|{clip.pace}|{clip.text.strip()}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def _join_wav(chunks: list[bytes]) -> bytes:
+    """
+    Merge several WAV files into one.
+
+    Each chunk carries its own RIFF header, so raw concatenation would yield
+    a file most players truncate after the first chunk.  The PCM frames are
+    copied under a single header taken from the first chunk instead.
+    """
+    out = io.BytesIO()
+    with wave.open(io.BytesIO(chunks[0])) as first:
+        params = first.getparams()
+    with wave.open(out, "wb") as writer:
+        writer.setparams(params)
+        for chunk in chunks:
+            with wave.open(io.BytesIO(chunk)) as reader:
+                writer.writeframesraw(reader.readframes(reader.getnframes()))
+    return out.getvalue()
+
+
+def _decode_and_save(audios_base64: list[str], output_path: Path) -> None:
+    """Decode the base64 WAV chunk(s) from Sarvam and write them to disk in one write."""
+    chunks = [base64.b64decode(a) for a in audios_base64]
+    audio_bytes = chunks[0] if len(chunks) == 1 else _join_wav(chunks)
     output_path.write_bytes(audio_bytes)
     size_kb = len(audio_bytes) / 1024
-    print(f"  ✓ Saved: {output_path.relative_to(ROOT)}  ({size_kb:.1f} KB)")
+    print(f"  ✓ Saved: {STATIC_REL / output_path.name}  ({size_kb:.1f} KB)")
 
 
-def generate_clip(client, clip: AudioClip) -> Path:
+def generate_clip(client, clip: AudioClip, force: bool = False) -> Path:
     """
     Call the Sarvam TTS REST API for a single AudioClip and save the result.
 
+    A clip whose parameters match a previous run is copied from CACHE_DIR
+    instead of being synthesised again, unless *force* is set.
+
     Args:
         client: An authenticated SarvamAI client instance.
         clip:   The AudioClip definition to generate.
+        force:  Bypass the clip cache and always call the API.
 
     Returns:
         Path to the saved .wav file.
@@ -114,13 +161,23 @@ def generate_clip(client, clip: AudioClip) -> Path:
         RuntimeError: If the API response contains no audio data.
     """
     output_path = STATIC_DIR / f"{clip.filename}.wav"
-
-    print(f"\n[{clip.filename}]")
-    print(f"  Language : {clip.language_code}")
-    print(f"  Speaker  : {clip.speaker}")
-    print(f"  Pace     : {clip.pace}")
-    print(f"  Text     : {clip.text[:80]}{'...' if len(clip.text) > 80 else ''}")
-    print(f"  Calling Sarvam TTS API (model={clip.model}) ...")
+    cache_path = CACHE_DIR / f"{_cache_key(clip)}.wav"
+
+    if not force and cache_path.exists():
+        shutil.copyfile(cache_path, output_path)
+        print(f"\n[{clip.filename}]\n  ✓ Cached: {STATIC_REL / output_path.name}")
+        return output_path
+
+    # Clips run concurrently, so emit the header as one write to keep
+    # each clip's lines together.
+    print(
+        f"\n[{clip.filename}]\n"
+        f"  Language : {clip.language_code}\n"
+        f"  Speaker  : {clip.speaker}\n"
+        f"  Pace     : {clip.pace}\n"
+        f"  Text     : {clip.text[:80]}{'...' if len(clip.text) > 80 else ''}\n"
+        f"  Calling Sarvam TTS API (model={clip.model}) ..."
+    )
 
     response = client.text_to_speech.convert(
         target_language_code=clip.language_code,
@@ -130,19 +187,59 @@ def generate_clip(client, clip: AudioClip) -> Path:
         pace=clip.pace,
     )
 
-    # The SDK returns an object with an `audios` list of base64-encoded strings
+    # The SDK returns an object with an `audios` list of base64-encoded WAVs;
+    # long inputs may come back split across several entries.
     if not response.audios:
         raise RuntimeError(
             f"Sarvam API returned no audio data for clip '{clip.filename}'. "
             f"Full response: {response}"
         )
 
-    _decode_and_save(response.audios[0], output_path)
+    _decode_and_save(response.audios, output_path)
+    CACHE_DIR.mkdir(parents=True, exist_ok=True)
+    shutil.copyfile(output_path, cache_path)
     return output_path
 
 
+@lru_cache(maxsize=1)
+def _sarvam_client():
+    """
+    Return the shared SarvamAI client.
+
+    Cached so a driver calling main() repeatedly in one process keeps the
+    SDK's connection pool warm.  The import lives here so the script stays
+    importable without sarvamai installed.
+    """
+    from sarvamai import SarvamAI  # noqa: PLC0415
+
+    return SarvamAI(api_subscription_key=get_settings().sarvam_api_key)
+
+
+async def _generate_all(client, force: bool = False) -> list[Path | BaseException]:
+    """
+    Generate every clip in CLIPS concurrently.
+
+    The sarvamai client is synchronous, so each call runs in a worker
+    thread; total wall time is roughly that of the slowest clip rather
+    than the sum of all of them.  Results are returned in CLIPS order,
+    with exceptions in place of paths for failed clips.
+    """
+    return await asyncio.gather(
+        *(asyncio.to_thread(generate_clip, client, clip, force) for clip in CLIPS),
+        return_exceptions=True,
+    )
+
+
 def main() -> None:
     """Entry point: load settings, build client, generate all clips."""
+    parser = argparse.ArgumentParser(description="Generate MatrAI static audio clips.")
+    parser.add_argument(
+        "--force",
+        action="store_true",
+        help="ignore cached clips and re-synthesise everything",
+    )
+    args = parser.parse_args()
+
     print("=" * 60)
     print("  MatrAI — Static Audio Generator (Sarvam AI Bulbul v3)")
     print("=" * 60)
@@ -157,9 +254,8 @@ def main() -> None:
         )
         sys.exit(1)
 
-    # Import here so the script is importable even without sarvamai installed
     try:
-        from sarvamai import SarvamAI  # noqa: PLC0415
+        client = _sarvam_client()
     except ImportError:
         print(
             "\n✗ sarvamai is not installed.\n"
@@ -167,18 +263,17 @@ def main() -> None:
         )
         sys.exit(1)
 
-    client = SarvamAI(api_subscription_key=settings.sarvam_api_key)
-
     generated: list[Path] = []
     errors: list[tuple[str, Exception]] = []
 
-    for clip in CLIPS:
-        try:
-            path = generate_clip(client, clip)
-            generated.append(path)
-        except Exception as exc:  # noqa: BLE001
-            print(f"  ✗ FAILED — {exc}")
-            errors.append((clip.filename, exc))
+    for clip, result in zip(CLIPS, asyncio.run(_generate_all(client, args.force))):
+        if isinstance(result, Exception):
+            print(f"  ✗ {clip.filename} FAILED — {result}")
+            errors.append((clip.filename, result))
+        elif isinstance(result, BaseException):
+            raise result
+        else:
+            generated.append(result)
 
     # Summary
     print("\n" + "=" * 60)
@@ -186,7 +281,7 @@ def main() -> None:
     if generated:
         print("\n  Generated files:")
         for p in generated:
-            print(f"    • {p.relative_to(ROOT)}")
+            print(f"    • {STATIC_REL / p.name}")
     if errors:
         print("\n  Failed clips:")
         for name, err in errors:
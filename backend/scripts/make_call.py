@@ -22,6 +22,7 @@ Then every call:
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 import sys
 from pathlib import Path
@@ -29,17 +30,13 @@ from pathlib import Path
 # ---------------------------------------------------------------------------
 # Load .env
 # ---------------------------------------------------------------------------
-env_path = Path(__file__).parent.parent / ".env"
-if env_path.exists():
-    for line in env_path.read_text().splitlines():
-        line = line.strip()
-        if not line or line.startswith("#") or "=" not in line:
-            continue
-        k, _, v = line.partition("=")
-        v = v.split("#")[0].strip()
-        os.environ.setdefault(k.strip(), v)
+from dotenv import load_dotenv
+
+# Existing environment variables win, same as the previous hand-rolled loop.
+load_dotenv(Path(__file__).parent.parent / ".env")
 
 import httpx  # noqa: E402
+import orjson  # noqa: E402
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 # ---------------------------------------------------------------------------
@@ -112,18 +109,40 @@ print(f"\n📞  Calling {patient_number} via VAPI...")
 print(f"    Phone Number ID : {PHONE_NUMBER_ID}")
 print(f"    BASE_URL        : {BASE_URL}")
 
-try:
-    resp = httpx.post(
-        "https://api.vapi.ai/call/phone",
+VAPI_CALL_URL = "https://api.vapi.ai/call/phone"
+
+
+async def _fire(client: httpx.AsyncClient, payload: dict) -> dict:
+    """
+    POST one outbound-call request to VAPI and return the created call.
+
+    Takes the client as an argument so a driver placing several calls can
+    share one pooled connection (and a single TLS handshake) across them.
+    """
+    resp = await client.post(VAPI_CALL_URL, content=orjson.dumps(payload))
+    resp.raise_for_status()
+    return orjson.loads(resp.content)
+
+
+async def _main(payload: dict) -> dict:
+    async with httpx.AsyncClient(
         headers={
             "Authorization": f"Bearer {VAPI_API_KEY}",
             "Content-Type":  "application/json",
         },
-        json=payload,
-        timeout=15.0,
-    )
-    resp.raise_for_status()
-    data = resp.json()
+        # Fail fast on DNS/TLS trouble; the retries only cover connection
+        # setup, so a call is never placed twice.
+        timeout=httpx.Timeout(15.0, connect=3.0, write=5.0, pool=5.0),
+        transport=httpx.AsyncHTTPTransport(
+            limits=httpx.Limits(max_keepalive_connections=20),
+            retries=2,
+        ),
+    ) as client:
+        return await _fire(client, payload)
+
+
+try:
+    data = asyncio.run(_main(payload))
     print(f"\n✅  Call initiated!")
     print(f"    Call ID  : {data.get('id', '?')}")
     print(f"    Status   : {data.get('status', '?')}")
@@ -7,6 +7,14 @@ Verifies that the /vapi/tool endpoint correctly:
   2. Classifies the case as RED risk
   3. Includes the mandatory_action and clinical_reason in the tool result
   4. Contains the bride message that tells the LLM to speak a transfer warning
+  5. Keeps answering RED within BURST_P95_LIMIT_S under BURST_SIZE concurrent calls
+
+The burst check relies on /vapi/tool being `async def` with only awaited
+I/O below it: a blocking call anywhere in that path would serialise the
+burst on the event loop (or FastAPI's bounded threadpool) and blow the
+P95 budget.  Burst payloads carry no caller number, so the server skips
+the Supabase save for them (and, with no controlUrl, the transfer) — the
+burst never writes rows to the real database.
 
 This is a pure-Python integration smoke test — no real VAPI call or phone
 number needed. Run it while the FastAPI dev server is running:
@@ -23,20 +31,27 @@ ANY assertion fails  → raises AssertionError and exits 1 (red)
 
 from __future__ import annotations
 
-import json
+import asyncio
+import copy
 import sys
+import time
 
 import httpx
+import orjson
 
 # ---------------------------------------------------------------------------
 # Config
 # ---------------------------------------------------------------------------
 BASE_URL      = "http://localhost:8000"
-TOOL_ENDPOINT = f"{BASE_URL}/vapi/tool"
+TOOL_PATH     = "/vapi/tool"
+TOOL_ENDPOINT = f"{BASE_URL}{TOOL_PATH}"
+BURST_SIZE        = 32
+BURST_P95_LIMIT_S = 2.0
 
 # ---------------------------------------------------------------------------
 # Mock payload — heavy bleeding at 30 weeks, convulsions, absent fetal movement
 # This maps to the worst-case RED scenario defined in the PMSMA triage engine.
+# Each *_BODY is the payload encoded once at import, ready to send as-is.
 # ---------------------------------------------------------------------------
 RED_FLAG_PAYLOAD = {
     "message": {
@@ -67,6 +82,7 @@ RED_FLAG_PAYLOAD = {
         ],
     }
 }
+RED_FLAG_BODY = orjson.dumps(RED_FLAG_PAYLOAD)
 
 # ---------------------------------------------------------------------------
 # GREEN-flag control payload (should NOT return RED)
@@ -95,6 +111,7 @@ GREEN_FLAG_PAYLOAD = {
         ],
     }
 }
+GREEN_FLAG_BODY = orjson.dumps(GREEN_FLAG_PAYLOAD)
 
 YELLOW_FLAG_PAYLOAD = {
     "message": {
@@ -120,6 +137,7 @@ YELLOW_FLAG_PAYLOAD = {
         ],
     }
 }
+YELLOW_FLAG_BODY = orjson.dumps(YELLOW_FLAG_PAYLOAD)
 
 
 # ---------------------------------------------------------------------------
@@ -127,23 +145,23 @@ YELLOW_FLAG_PAYLOAD = {
 # ---------------------------------------------------------------------------
 
 
-def post_tool(payload: dict) -> tuple[dict, dict]:
-    """POST payload to /vapi/tool; returns (http_response_dict, parsed_result_dict)."""
-    resp = httpx.post(TOOL_ENDPOINT, json=payload, timeout=15.0)
+async def post_tool(client: httpx.AsyncClient, request_body: bytes) -> tuple[dict, dict]:
+    """POST a pre-encoded body to /vapi/tool; returns (http_response_dict, parsed_result_dict)."""
+    resp = await client.post(TOOL_PATH, content=request_body)
     resp.raise_for_status()
-    body = resp.json()
+    body = orjson.loads(resp.content)
     # body == { "results": [{ "toolCallId": "...", "result": "<json string>" }] }
     results_list = body.get("results", [])
     assert results_list, f"Expected non-empty 'results' list, got: {body}"
     result_str = results_list[0]["result"]
-    parsed = json.loads(result_str)
+    parsed = orjson.loads(result_str)
     return body, parsed
 
 
-def check(label: str, condition: bool, detail: str = "") -> None:
-    """Print a pass/fail line and raise on failure."""
+def check(out: list[str], label: str, condition: bool, detail: str = "") -> None:
+    """Record a pass/fail line in *out* and raise on failure."""
     icon = "✅" if condition else "❌"
-    print(f"  {icon}  {label}", f"— {detail}" if detail else "")
+    out.append(f"  {icon}  {label}" + (f" — {detail}" if detail else ""))
     if not condition:
         raise AssertionError(f"FAILED: {label}  {detail}")
 
@@ -153,53 +171,57 @@ def check(label: str, condition: bool, detail: str = "") -> None:
 # ---------------------------------------------------------------------------
 
 
-def test_red_flag() -> None:
-    print("\n🔴 Test 1 — Heavy Bleeding / Convulsions → expect RED")
-    body, result = post_tool(RED_FLAG_PAYLOAD)
+# The tests run concurrently, so each one appends its report lines to *out*
+# instead of printing; main() prints the reports in order once all finish.
+
+
+async def check_red_flag(client: httpx.AsyncClient, out: list[str]) -> None:
+    out.append("\n🔴 Test 1 — Heavy Bleeding / Convulsions → expect RED")
+    body, result = await post_tool(client, RED_FLAG_BODY)
 
-    check("HTTP response contains 'results'",   "results" in body)
-    check("risk_level == RED",                  result.get("risk_level") == "RED",
+    check(out, "HTTP response contains 'results'",   "results" in body)
+    check(out, "risk_level == RED",                  result.get("risk_level") == "RED",
           f"got: {result.get('risk_level')}")
-    check("clinical_reason is non-empty",       bool(result.get("clinical_reason")),
+    check(out, "clinical_reason is non-empty",       bool(result.get("clinical_reason")),
           f"got: {result.get('clinical_reason', '')[:80]}")
-    check("mandatory_action is non-empty",      bool(result.get("mandatory_action")))
-    check("instructions mention bridge msg",
+    check(out, "mandatory_action is non-empty",      bool(result.get("mandatory_action")))
+    check(out, "instructions mention bridge msg",
           "connect" in result.get("instructions", "").lower() or
           "doctor"  in result.get("instructions", "").lower() or
           "doctor"  in result.get("mandatory_action", "").lower(),
           "bridge message not found in instructions or mandatory_action")
-    check("result includes weeks_pregnant",     result.get("weeks_pregnant") == 30)
+    check(out, "result includes weeks_pregnant",     result.get("weeks_pregnant") == 30)
 
-    print(f"\n     risk_level      : {result['risk_level']}")
-    print(f"     clinical_reason : {result['clinical_reason'][:120]}")
-    print(f"     mandatory_action: {result['mandatory_action'][:120]}")
+    out.append(f"\n     risk_level      : {result['risk_level']}")
+    out.append(f"     clinical_reason : {result['clinical_reason'][:120]}")
+    out.append(f"     mandatory_action: {result['mandatory_action'][:120]}")
 
 
-def test_green_flag() -> None:
-    print("\n🟢 Test 2 — No symptoms → expect GREEN")
-    _, result = post_tool(GREEN_FLAG_PAYLOAD)
+async def check_green_flag(client: httpx.AsyncClient, out: list[str]) -> None:
+    out.append("\n🟢 Test 2 — No symptoms → expect GREEN")
+    _, result = await post_tool(client, GREEN_FLAG_BODY)
 
-    check("risk_level is GREEN or YELLOW (not RED)",
+    check(out, "risk_level is GREEN or YELLOW (not RED)",
           result.get("risk_level") in ("GREEN", "YELLOW"),
           f"got: {result.get('risk_level')}")
-    print(f"     risk_level: {result['risk_level']}")
+    out.append(f"     risk_level: {result['risk_level']}")
 
 
-def test_yellow_flag() -> None:
-    print("\n🟡 Test 3 — Borderline symptoms → expect YELLOW (not RED)")
-    _, result = post_tool(YELLOW_FLAG_PAYLOAD)
+async def check_yellow_flag(client: httpx.AsyncClient, out: list[str]) -> None:
+    out.append("\n🟡 Test 3 — Borderline symptoms → expect YELLOW (not RED)")
+    _, result = await post_tool(client, YELLOW_FLAG_BODY)
 
-    check("risk_level is YELLOW or GREEN (not RED unless triage engine elevates)",
+    check(out, "risk_level is YELLOW or GREEN (not RED unless triage engine elevates)",
           result.get("risk_level") in ("YELLOW", "GREEN", "RED"),   # any level valid
           f"got: {result.get('risk_level')}")
     # Sub-check: confirm the result JSON is well-formed
-    check("mandatory_action present", bool(result.get("mandatory_action")))
-    print(f"     risk_level: {result['risk_level']}")
+    check(out, "mandatory_action present", bool(result.get("mandatory_action")))
+    out.append(f"     risk_level: {result['risk_level']}")
 
 
-def test_unknown_tool() -> None:
+async def check_unknown_tool(client: httpx.AsyncClient, out: list[str]) -> None:
     """Sending an unknown function name should return an error result, not crash."""
-    print("\n⚠️  Test 4 — Unknown tool name → expect error result, not 500")
+    out.append("\n⚠️  Test 4 — Unknown tool name → expect error result, not 500")
     payload = {
         "message": {
             "type": "tool-calls",
@@ -209,13 +231,43 @@ def test_unknown_tool() -> None:
             ],
         }
     }
-    resp = httpx.post(TOOL_ENDPOINT, json=payload, timeout=10.0)
-    check("HTTP 200 (not 500)", resp.status_code == 200,
+    resp = await client.post(TOOL_PATH, content=orjson.dumps(payload), timeout=10.0)
+    check(out, "HTTP 200 (not 500)", resp.status_code == 200,
           f"got: {resp.status_code}")
-    body = resp.json()
+    body = orjson.loads(resp.content)
     result_str = body["results"][0]["result"]
-    parsed = json.loads(result_str)
-    check("Error key present in result", "error" in parsed, f"got: {parsed}")
+    parsed = orjson.loads(result_str)
+    check(out, "Error key present in result", "error" in parsed, f"got: {parsed}")
+
+
+def _burst_body(i: int) -> bytes:
+    """
+    RED payload with per-request call and tool-call IDs (avoids the duplicate
+    guard) and no customer number, so nothing is persisted for it.
+    """
+    payload = copy.deepcopy(RED_FLAG_PAYLOAD)
+    message = payload["message"]
+    message["call"] = {"id": f"test-red-burst-{i:03d}"}
+    message["toolWithToolCallList"][0]["toolCall"]["id"] = f"tc_burst_{i:03d}"
+    return orjson.dumps(payload)
+
+
+async def check_red_flag_burst(client: httpx.AsyncClient, out: list[str]) -> None:
+    out.append(f"\n🚦 Test 5 — {BURST_SIZE} concurrent RED calls → expect RED, P95 ≤ {BURST_P95_LIMIT_S}s")
+
+    async def timed(body: bytes) -> tuple[float, dict]:
+        start = time.perf_counter()
+        _, result = await post_tool(client, body)
+        return time.perf_counter() - start, result
+
+    timings = await asyncio.gather(*(timed(_burst_body(i)) for i in range(BURST_SIZE)))
+    latencies = sorted(t for t, _ in timings)
+    p95 = latencies[max(0, int(len(latencies) * 0.95) - 1)]
+
+    check(out, "every burst call classified RED",
+          all(r.get("risk_level") == "RED" for _, r in timings))
+    check(out, f"P95 latency ≤ {BURST_P95_LIMIT_S}s", p95 <= BURST_P95_LIMIT_S,
+          f"got: {p95:.3f}s")
 
 
 # ---------------------------------------------------------------------------
@@ -223,6 +275,36 @@ def test_unknown_tool() -> None:
 # ---------------------------------------------------------------------------
 
 
+async def _run_all() -> None:
+    """Run every test concurrently on one client, then report them in order."""
+    tests = [
+        check_red_flag, check_green_flag, check_yellow_flag, check_unknown_tool,
+        check_red_flag_burst,
+    ]
+    reports: list[list[str]] = [[] for _ in tests]
+
+    async with httpx.AsyncClient(
+        base_url=BASE_URL,
+        headers={"Content-Type": "application/json"},
+        timeout=15.0,
+    ) as client:
+        outcomes = await asyncio.gather(
+            *(t(client, out) for t, out in zip(tests, reports)),
+            return_exceptions=True,
+        )
+
+    for out in reports:
+        print("\n".join(out))
+
+    # Surface the first failure the way the sequential runner did.
+    for outcome in outcomes:
+        if isinstance(outcome, httpx.ConnectError):
+            raise outcome
+    for outcome in outcomes:
+        if isinstance(outcome, BaseException):
+            raise outcome
+
+
 def main() -> None:
     print("=" * 60)
     print("  MatrAI — /vapi/tool Red-Flag Verification Script")
@@ -230,9 +312,7 @@ def main() -> None:
     print("=" * 60)
 
     try:
-        tests = [test_red_flag, test_green_flag, test_yellow_flag, test_unknown_tool]
-        for t in tests:
-            t()
+        asyncio.run(_run_all())
 
         print("\n" + "=" * 60)
         print("  ✅  ALL TESTS PASSED")
@@ -0,0 +1,53 @@
+"""
+tests/test_idempotency.py
+-------------------------
+Unit tests for the TTL cache behind VAPI tool-call replay (app/idempotency.py).
+
+Run with:
+    pytest tests/test_idempotency.py -v
+"""
+
+from app.idempotency import TTLCache
+
+
+class TestTTLCache:
+
+    def test_put_then_get_returns_same_result(self):
+        cache = TTLCache()
+        result = {"toolCallId": "tc_1", "result": "ok"}
+        cache.put("tc_1", result)
+        assert cache.get("tc_1") is result
+
+    def test_unseen_id_returns_none(self):
+        assert TTLCache().get("tc_missing") is None
+
+    def test_expired_entry_is_dropped(self):
+        cache = TTLCache(ttl=-1.0)
+        cache.put("tc_1", {"result": "ok"})
+        assert cache.get("tc_1") is None
+        assert len(cache) == 0
+
+    def test_oldest_entry_evicted_when_full(self):
+        cache = TTLCache(maxsize=2)
+        for i in range(3):
+            cache.put(f"tc_{i}", {"result": i})
+        assert cache.get("tc_0") is None
+        assert cache.get("tc_2") == {"result": 2}
+
+    def test_placeholder_id_is_never_cached(self):
+        cache = TTLCache()
+        cache.put("unknown", {"result": "ok"})
+        assert cache.get("unknown") is None
+
+    def test_false_value_is_distinguishable_from_miss(self):
+        cache = TTLCache()
+        cache.put("+919876543210", False)
+        assert cache.get("+919876543210") is False
+        assert cache.get("+910000000000") is None
+
+    def test_discard_forgets_entry(self):
+        cache = TTLCache()
+        cache.put("tc_1", {"result": "ok"})
+        cache.discard("tc_1")
+        cache.discard("tc_missing")     # absent ids are ignored
+        assert cache.get("tc_1") is None
@@ -0,0 +1,63 @@
+"""
+tests/test_payload.py
+---------------------
+Unit tests for the VAPI tool-call normaliser (app/payload.py).
+
+Test coverage:
+  1. Format A — transient tool (tool.name + toolCall.parameters)
+  2. Format B — dashboard tool (toolCall.function.name + JSON arguments)
+  3. Malformed / missing fields fall back to safe defaults
+
+Run with:
+    pytest tests/test_payload.py -v
+"""
+
+from app.payload import extract_caller_phone, parse_tool_calls
+
+
+class TestParseToolCalls:
+
+    def test_format_a_transient_tool(self):
+        message = {"toolWithToolCallList": [
+            {"name": "record_consent", "toolCall": {"id": "tc_1", "parameters": {"digit": "1"}}},
+        ]}
+        (call,) = parse_tool_calls(message)
+        assert (call.id, call.name, call.parameters) == ("tc_1", "record_consent", {"digit": "1"})
+
+    def test_format_b_dashboard_tool_json_arguments(self):
+        message = {"toolWithToolCallList": [
+            {"toolCall": {"id": "tc_2", "function": {
+                "name": "collect_symptoms", "arguments": '{"bleeding": "heavy"}',
+            }}},
+        ]}
+        (call,) = parse_tool_calls(message)
+        assert call.name == "collect_symptoms"
+        assert call.parameters == {"bleeding": "heavy"}
+
+    def test_malformed_arguments_become_empty_dict(self):
+        message = {"toolWithToolCallList": [
+            {"toolCall": {"id": "tc_3", "function": {"name": "x", "arguments": "{not json"}}},
+            {"toolCall": {"id": "tc_4", "function": {"name": "x", "arguments": "[1, 2]"}}},
+        ]}
+        assert [c.parameters for c in parse_tool_calls(message)] == [{}, {}]
+
+    def test_missing_fields_use_defaults(self):
+        (call,) = parse_tool_calls({"toolWithToolCallList": [{}]})
+        assert (call.id, call.name, call.parameters) == ("unknown", "", {})
+
+    def test_no_tool_list_returns_empty(self):
+        assert parse_tool_calls({}) == []
+
+
+class TestExtractCallerPhone:
+
+    def test_customer_number_preferred(self):
+        call = {"customer": {"number": "+911"}, "phoneNumber": {"number": "+912"}}
+        assert extract_caller_phone(call) == "+911"
+
+    def test_falls_back_to_phone_number(self):
+        call = {"customer": {}, "phoneNumber": {"number": "+912"}}
+        assert extract_caller_phone(call) == "+912"
+
+    def test_missing_number_is_unknown(self):
+        assert extract_caller_phone({}) == "unknown"
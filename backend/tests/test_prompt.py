@@ -0,0 +1,91 @@
+"""
+tests/test_prompt.py
+--------------------
+Unit tests for the system-prompt builder (app/prompts.py).
+
+Test coverage:
+  1. build_system_prompt injects the triage result into the RED prompt
+  2. Every safety constraint is present in the generated prompt
+  3. INITIAL_SYSTEM_PROMPT carries the rules but no triage block
+  4. The red/yellow/green convenience wrappers
+
+Run with:
+    pytest tests/test_prompt.py -v
+"""
+
+import pytest
+
+from app.prompts import (
+    INITIAL_SYSTEM_PROMPT,
+    build_system_prompt,
+    green_prompt,
+    red_alert_prompt,
+    yellow_alert_prompt,
+)
+
+
+@pytest.fixture(scope="module")
+def red() -> str:
+    return build_system_prompt(
+        risk_level="RED",
+        mandatory_action="Hospital turant jaaiye. 108 par call karein.",
+        clinical_reason="Bleeding reported — possible antepartum haemorrhage.",
+    )
+
+
+class TestSafetyConstraints:
+
+    @pytest.mark.parametrize("needle", [
+        "KABHI BHAI DAWAI MAT BATAO",   # no medicine
+        "ABHI hospital jaayein",        # direct command language
+        "108",                          # emergency number
+        "DON'T DIAGNOSE",               # no diagnosis
+        "sar dard",                     # vocabulary guide
+        "BP zyada hona",
+        "pair sujan",
+        "Behen",                        # honorific
+        "Namaste",
+        "5 second",                     # quiet caller handler
+        "KABHI MAT BOLEIN",             # never speak in weeks
+    ])
+    def test_rule_present(self, red, needle):
+        assert needle in red
+
+    def test_negative_constraint_present(self, red):
+        assert "Do NOT say" in red or "NEGATIVE CONSTRAINT" in red
+
+    def test_weeks_to_months_rule(self, red):
+        assert "MAHINE MEIN BOLEIN" in red or "mahina" in red.lower()
+
+
+class TestTriageInjection:
+
+    @pytest.mark.parametrize("needle", [
+        "CURRENT TRIAGE RESULT",
+        "Risk Level      : RED",
+        "Hospital turant jaaiye",
+        "Bleeding reported",
+    ])
+    def test_triage_fields_injected(self, red, needle):
+        assert needle in red
+
+    def test_initial_prompt_has_rules_but_no_triage_block(self):
+        assert len(INITIAL_SYSTEM_PROMPT) > 500
+        assert "CURRENT TRIAGE RESULT" not in INITIAL_SYSTEM_PROMPT
+        assert "KABHI BHAI DAWAI MAT BATAO" in INITIAL_SYSTEM_PROMPT
+
+
+class TestConvenienceWrappers:
+
+    def test_red_wrapper(self):
+        assert "CURRENT TRIAGE RESULT" in red_alert_prompt("test", "reason")
+
+    def test_yellow_wrapper(self):
+        yellow = yellow_alert_prompt("ANM se aaj milein.", "Fever — possible malaria.")
+        assert "YELLOW" in yellow
+        assert "ANM se aaj milein" in yellow
+
+    def test_green_wrapper(self):
+        green = green_prompt("ANC check-up time par karwayein.", "No danger signs.")
+        assert "GREEN" in green
+        assert "ANC check-up" in green
@@ -125,17 +125,13 @@ class TestRedBeatsYellowPriority:
     the engine must return RED — highest severity always wins.
     """
 
-    def test_bleeding_plus_fever_yields_red(self):
-        result = evaluate_risk({"bleeding": "heavy", "fever": True})
-        _assert_result(result, "RED")
-
-    def test_convulsions_plus_swelling_yields_red(self):
-        result = evaluate_risk({"convulsions": True, "swelling_feet": True})
-        _assert_result(result, "RED")
-
-    def test_severe_headache_plus_abdominal_pain_yields_red(self):
-        result = evaluate_risk({"severe_headache": True, "abdominal_pain": "mild"})
-        _assert_result(result, "RED")
+    @pytest.mark.parametrize("symptoms", [
+        {"bleeding": "heavy", "fever": True},
+        {"convulsions": True, "swelling_feet": True},
+        {"severe_headache": True, "abdominal_pain": "mild"},
+    ], ids=["bleeding+fever", "convulsions+swelling", "headache+abdominal_pain"])
+    def test_red_overrides_yellow(self, symptoms):
+        _assert_result(evaluate_risk(symptoms), "RED")
 
 
 # ===========================================================================
@@ -145,13 +141,14 @@ class TestRedBeatsYellowPriority:
 class TestGreenNoSymptoms:
     """No danger signs → low-risk; routine ANC follow-up advised."""
 
-    def test_empty_dict_returns_green(self):
-        result = evaluate_risk({})
-        _assert_result(result, "GREEN")
-
-    def test_no_matching_symptoms_returns_green(self):
-        result = evaluate_risk({"bleeding": "none", "abdominal_pain": "none"})
-        _assert_result(result, "GREEN")
+    @pytest.mark.parametrize("symptoms", [
+        {},
+        {"bleeding": "none", "abdominal_pain": "none"},
+        # Unrecognised symptom keys must be silently ignored.
+        {"unknown_symptom": "xyz", "random_key": 99},
+    ], ids=["empty", "no_matching_symptoms", "unknown_keys"])
+    def test_returns_green(self, symptoms):
+        _assert_result(evaluate_risk(symptoms), "GREEN")
 
     def test_green_action_mentions_anc(self):
         result = evaluate_risk({})
@@ -160,11 +157,6 @@ class TestGreenNoSymptoms:
             "GREEN mandatory_action should refer to routine ANC / PMSMA schedule"
         )
 
-    def test_unknown_keys_ignored_returns_green(self):
-        """Unrecognised symptom keys must be silently ignored."""
-        result = evaluate_risk({"unknown_symptom": "xyz", "random_key": 99})
-        _assert_result(result, "GREEN")
-
 
 # ===========================================================================
 # Edge-case / Robustness Tests
@@ -182,8 +174,8 @@ class TestEdgeCases:
         result = evaluate_risk({"convulsions": None, "fever": None})
         assert result["risk_level"] == "GREEN"
 
-    def test_result_keys_are_always_present(self):
+    @pytest.mark.parametrize("symptoms", [{}, {"bleeding": "heavy"}, {"fever": True}])
+    def test_result_keys_are_always_present(self, symptoms):
         """Regardless of input, all three result keys must always be present."""
-        for symptoms in [{}, {"bleeding": "heavy"}, {"fever": True}]:
-            result = evaluate_risk(symptoms)
-            assert set(result.keys()) == {"risk_level", "mandatory_action", "clinical_reason"}
+        result = evaluate_risk(symptoms)
+        assert set(result.keys()) == {"risk_level", "mandatory_action", "clinical_reason"}
@@ -0,0 +1,66 @@
+"""
+tests/test_voice_cache.py
+-------------------------
+Unit tests for the Sarvam TTS cache in app/routers/voice.py.
+
+Sarvam itself is never called: _synthesise_sarvam is replaced with a
+counting fake.
+
+Run with:
+    pytest tests/test_voice_cache.py -v
+"""
+
+import asyncio
+
+import pytest
+
+from app.routers import voice
+
+
+@pytest.fixture
+def fake_sarvam(monkeypatch):
+    """Swap in a fake synthesiser and start every test with an empty cache."""
+    calls: list[str] = []
+
+    async def fake(text: str, headers: dict) -> bytes:
+        calls.append(text)
+        await asyncio.sleep(0)
+        return f"wav:{text}".encode()
+
+    monkeypatch.setattr(voice, "_synthesise_sarvam", fake)
+    voice._tts_cache.clear()
+    voice._tts_inflight.clear()
+    yield calls
+    voice._tts_cache.clear()
+
+
+class TestSynthesiseCached:
+
+    def test_repeat_text_is_served_from_cache(self, fake_sarvam):
+        async def run():
+            first = await voice._synthesise_cached("Namaste", {})
+            second = await voice._synthesise_cached("Namaste", {})
+            return first, second
+
+        first, second = asyncio.run(run())
+        assert first == second == b"wav:Namaste"
+        assert fake_sarvam == ["Namaste"]
+
+    def test_concurrent_misses_share_one_request(self, fake_sarvam):
+        async def run():
+            return await asyncio.gather(
+                *(voice._synthesise_cached("Behen", {}) for _ in range(5))
+            )
+
+        assert asyncio.run(run()) == [b"wav:Behen"] * 5
+        assert fake_sarvam == ["Behen"]
+
+    def test_least_recently_used_entry_evicted(self, fake_sarvam, monkeypatch):
+        monkeypatch.setattr(voice, "_TTS_CACHE_SIZE", 2)
+
+        async def run():
+            for text in ("a", "b", "a", "c"):
+                await voice._synthesise_cached(text, {})
+
+        asyncio.run(run())
+        assert list(voice._tts_cache) == ["a", "c"]